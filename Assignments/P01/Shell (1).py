@@ -7,17 +7,28 @@ This file is about capturing the user input so that you can mimic shell behavior
 """
 import os
 import random
+import heapq
+import io
 import sys
-import subprocess
 import shutil
 import time
 import pwd
 import grp
 import readline
 import stat
+import signal
+import errno
+import select
+import termios
+import tty
+import atexit
+import codecs
 from rich import print
 from getch import Getch
 from pathlib import Path
+from itertools import islice
+from functools import lru_cache
+from collections import deque
 
 ##################################################################################
 ##################################################################################
@@ -27,72 +38,175 @@ getch = Getch()  # create instance of our getch class
 
 prompt = "$"  # set default prompt
 
+CLEAR_SEQ = "\x1b[H\x1b[2J"  # ANSI home + clear screen, same bytes `clear` would print
+
+# Terminal width is queried once and only re-queried after the window is resized
+_term_cols = None
+
+def _on_resize(signum, frame):
+    global _term_cols
+    _term_cols = None
+
+if hasattr(signal, "SIGWINCH"):
+    signal.signal(signal.SIGWINCH, _on_resize)
+
+def get_cols():
+    global _term_cols
+    if _term_cols is None:
+        _term_cols = shutil.get_terminal_size(fallback=(80, 20)).columns
+    return _term_cols
+
 #search for history file, then use readline to load previous commands into the shell
 HISTORY_FILE = os.path.expanduser("~/.myshell_history")
 
+MAX_HISTORY = 1000            # most recent commands kept in memory
+HISTORY_WINDOW = 64 * 1024    # only this much of the end of the file is read at startup
+
+HISTORY_FLUSH_INTERVAL = 5.0  # seconds between history writes while commands are running
+
+_history_pending = 0  # commands added since the last save
+_history_on_disk = 0  # lines currently in the history file
+_history_fd = None    # O_APPEND descriptor opened once by open_history()
+_history_flushed_at = 0.0
+
 def load_history():
+    """Loads the last MAX_HISTORY commands into a bounded deque, reading at
+    most HISTORY_WINDOW bytes from the end of the history file."""
+    global _history_on_disk
     if os.path.exists(HISTORY_FILE):
-        with open(HISTORY_FILE, "r") as f:
-            return [line.rstrip("\n") for line in f]
-    return []
+        with open(HISTORY_FILE, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > HISTORY_WINDOW:
+                f.seek(size - HISTORY_WINDOW)
+                f.readline()  # drop the partial first line
+            data = f.read()
+        loaded = data.decode("utf-8", errors="replace").splitlines()
+        # a file bigger than the window has an unknown line count, so mark it
+        # due for compaction on the first save
+        _history_on_disk = 2 * MAX_HISTORY if size > HISTORY_WINDOW else len(loaded)
+        return deque(loaded, maxlen=MAX_HISTORY)
+    return deque(maxlen=MAX_HISTORY)
+
+def add_history(cmd_history, cmd):
+    """Records a submitted command and lets flush_history decide whether to save."""
+    global _history_pending
+    cmd_history.append(cmd)
+    _history_pending += 1
+    flush_history(cmd_history)
 
 def save_history(cmd_history):
+    """Appends only the entries not yet on disk. Once the file holds twice
+    MAX_HISTORY lines it is compacted to what the deque still holds."""
+    global _history_pending, _history_on_disk, _history_flushed_at
+    _history_flushed_at = time.monotonic()
+    if not _history_pending:
+        return
     try:
-        with open(HISTORY_FILE, "w") as f:
-            for cmd in cmd_history:
-                f.write(cmd + "\n")
+        compact = _history_on_disk + _history_pending > 2 * MAX_HISTORY
+        if compact:
+            lines = cmd_history
+        else:
+            lines = islice(cmd_history, max(len(cmd_history) - _history_pending, 0), None)
+        data = "".join(cmd + "\n" for cmd in lines)
+        if _history_fd is not None:
+            # one write(2) on the already-open descriptor
+            if compact:
+                os.ftruncate(_history_fd, 0)
+            os.write(_history_fd, data.encode())
+        else:
+            with open(HISTORY_FILE, "w" if compact else "a") as f:
+                f.write(data)
+        if compact:
+            _history_on_disk = len(cmd_history)
+        else:
+            _history_on_disk += min(_history_pending, len(cmd_history))
+        _history_pending = 0
     except Exception as e:
         print(f"Error saving history: {e}", file=sys.stderr)
 
-def parse_cmd(cmd_input):
-    command_list = []
+def flush_history(cmd_history):
+    """Coalesced save for the per-command path: writes at most once per
+    HISTORY_FLUSH_INTERVAL. Exit goes through save_history directly."""
+    if time.monotonic() - _history_flushed_at >= HISTORY_FLUSH_INTERVAL:
+        save_history(cmd_history)
+
+def open_history():
+    """Opens the history file once for appending so each save is a single write."""
+    global _history_fd
+    try:
+        _history_fd = os.open(HISTORY_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+    except OSError as e:
+        print(f"Error opening history: {e}", file=sys.stderr)
+
+@lru_cache(maxsize=256)
+def _tokenize(cmd_input):
+    """Splits a command line into (cmd, params, flags, redirect) tuples, one
+    per pipeline stage. Immutable so repeated commands can share the result."""
+    stages = []
     cmds = [c.strip() for c in cmd_input.split("|")]
 
     for cmd in cmds:
-        d = {"input": None, "cmd": None, "params": [], "flags": None, "redirect": None}
+        name, params, flags, redirect = None, [], None, None
         parts = cmd.split()
         i = 0
         while i < len(parts):
             part = parts[i]
             if i == 0:
-                d["cmd"] = part
+                name = part
             elif part.startswith("-") and len(part) > 1:
                 if part[1:] in ["n"]:  # flags that take an argument
                     if i + 1 < len(parts):
-                        d["flags"] = f"{part[1:]}{parts[i + 1]}"
+                        flags = f"{part[1:]}{parts[i + 1]}"
                         i += 1
                     else:
-                        d["flags"] = part[1:]
+                        flags = part[1:]
                 else:
-                    d["flags"] = part[1:]
+                    flags = part[1:]
             elif part == ">":
                 if i + 1 < len(parts):
-                    d["redirect"] = parts[i + 1]
+                    redirect = parts[i + 1]
                     i += 1
                 else:
-                    d["redirect"] = None
+                    redirect = None
             else:
-                d["params"].append(part)
+                params.append(part)
             i += 1
-        command_list.append(d)
-    return command_list
+        stages.append((name, tuple(params), flags, redirect))
+    return tuple(stages)
+
+def parse_cmd(cmd_input):
+    # Fresh dicts every call: commands fill in "input" and may edit params
+    return [
+        {"input": None, "cmd": name, "params": list(params), "flags": flags, "redirect": redirect}
+        for name, params, flags, redirect in _tokenize(cmd_input)
+    ]
  
 
 def print_cmd(cmd, cursor_pos=None):
     """Cleans the line, prints the cmd with prompt,
     and repositions the cursor if needed."""
-    padding = " " * 80
-    sys.stdout.write("\r" + padding)        # clear line
-    sys.stdout.write("\r" + prompt + cmd)   # reprint line
+    # reprint line, then erase whatever is left of the old one ("\x1b[K" = clear to end of line)
+    frame = "\r" + prompt + cmd + "\x1b[K"
 
     if cursor_pos is not None:
         # Move cursor back from the end to correct position
         back_moves = len(cmd) - cursor_pos
         if back_moves > 0:
-            sys.stdout.write("\b" * back_moves)
+            frame += "\b" * back_moves
 
+    # One write per redraw instead of one per piece
+    sys.stdout.write(frame)
     sys.stdout.flush()
 
+_MODE_CACHE = {}  # st_mode -> "drwxr-xr-x"; real directories only use a handful of modes
+
+def filemode(mode):
+    s = _MODE_CACHE.get(mode)
+    if s is None:
+        s = stat.filemode(mode)
+        _MODE_CACHE[mode] = s
+    return s
+
 def ls(parts):
     """
     ls-like command supporting:
@@ -114,26 +228,44 @@ def ls(parts):
             s /= 1024
         return f"{s:.1f}E"
 
+    # Owner/group names looked up once per uid/gid for this listing
+    uid_cache = {}
+    gid_cache = {}
+
+    def lookup_user(uid):
+        name = uid_cache.get(uid)
+        if name is None:
+            try:
+                name = pwd.getpwuid(uid).pw_name
+            except KeyError:
+                name = str(uid)
+            uid_cache[uid] = name
+        return name
+
+    def lookup_group(gid):
+        name = gid_cache.get(gid)
+        if name is None:
+            try:
+                name = grp.getgrgid(gid).gr_name
+            except KeyError:
+                name = str(gid)
+            gid_cache[gid] = name
+        return name
+
     def format_entry(full_path, stats, name_override=None):
         e = name_override or os.path.basename(full_path)
         if "l" not in flags:
             return e
 
         # Permissions and type
-        perms = stat.filemode(stats.st_mode)
+        perms = filemode(stats.st_mode)
 
         # Links
         nlink = stats.st_nlink
 
         # Owner and group
-        try:
-            owner = pwd.getpwuid(stats.st_uid).pw_name
-        except KeyError:
-            owner = str(stats.st_uid)
-        try:
-            group = grp.getgrgid(stats.st_gid).gr_name
-        except KeyError:
-            group = str(stats.st_gid)
+        owner = lookup_user(stats.st_uid)
+        group = lookup_group(stats.st_gid)
 
         # Size
         size = stats.st_size
@@ -155,7 +287,7 @@ def ls(parts):
         return f"{perms} {nlink:3} {owner:8} {group:8} {size_str:>8} {mtime} {e_display}"
 
     def format_columns(entries):
-        cols, _ = shutil.get_terminal_size(fallback=(80, 20))
+        cols = get_cols()
         if not entries:
             return ""
         max_len = max(len(e) for e in entries) + 2
@@ -180,17 +312,18 @@ def ls(parts):
                 results.append(f"ls: cannot access '{path}': {e}")
             continue
 
-        # Directory
+        # Directory (scandir entries carry their joined path and cached stat)
         try:
-            entries = os.listdir(path)
+            with os.scandir(path) as it:
+                entries = list(it)
         except PermissionError:
             results.append(f"ls: cannot open directory '{path}': Permission denied")
             continue
 
         if "a" not in flags:
-            entries = [e for e in entries if not e.startswith(".")]
+            entries = [e for e in entries if not e.name.startswith(".")]
 
-        entries.sort()
+        entries.sort(key=lambda e: e.name)
 
         if len(params) > 1:
             results.append(f"{path}:")
@@ -198,15 +331,14 @@ def ls(parts):
         if "l" in flags:
             lines = []
             for e in entries:
-                full_path = os.path.join(path, e)
                 try:
-                    stats = os.lstat(full_path)
+                    stats = e.stat(follow_symlinks=False)
                 except Exception:
                     continue
-                lines.append(format_entry(full_path, stats, e))
+                lines.append(format_entry(e.path, stats, e.name))
             results.append("\n".join(lines))
         else:
-            results.append(format_columns(entries))
+            results.append(format_columns([e.name for e in entries]))
 
     return {"output": "\n".join(results), "error": None}
 
@@ -230,40 +362,71 @@ def rm(parts):
     force = "f" in flags or "--force" in params
     recursive = "r" in flags or "--recursive" in params
 
+    euid = os.geteuid()
+    groups = set(os.getgroups()) | {os.getegid()}
+
+    def write_protected(st):
+        # Same answer os.access(W_OK) would give, decoded from the lstat we already have
+        if euid == 0 or stat.S_ISLNK(st.st_mode):
+            return False
+        if st.st_uid == euid:
+            bit = stat.S_IWUSR
+        elif st.st_gid in groups:
+            bit = stat.S_IWGRP
+        else:
+            bit = stat.S_IWOTH
+        return not st.st_mode & bit
+
+    def remove_file(path, st):
+        try:
+            if not force:
+                if write_protected(st):
+                    confirm = input(f"rm: remove write-protected file '{path}'? [y/N] ")
+                    if confirm.lower() != "y":
+                        return None
+            if force:
+                os.chmod(path, stat.S_IWUSR | stat.S_IRUSR)
+            os.unlink(path)
+        except Exception as e:
+            return f"rm: cannot remove '{path}': {e}"
+        return None
+
+    def remove_tree(path):
+        try:
+            # DirEntry.path is already joined and is_dir() comes from the dirent type
+            with os.scandir(path) as it:
+                entries = list(it)
+            for de in entries:
+                if de.is_dir(follow_symlinks=False):
+                    err = remove_tree(de.path)
+                else:
+                    # the stat is only needed for the write-protect prompt
+                    err = remove_file(de.path, None if force else de.stat(follow_symlinks=False))
+                if err:
+                    return err
+            os.rmdir(path)
+        except Exception as e:
+            return f"rm: cannot remove '{path}': {e}"
+        return None
+
     def remove_path(path):
-        if not os.path.exists(path):
+        # One lstat decides file vs directory instead of exists/isfile/islink/isdir
+        try:
+            st = os.lstat(path)
+        except FileNotFoundError:
             if not force:
                 return f"rm: cannot remove '{path}': No such file or directory"
             return None
+        except Exception as e:
+            return f"rm: cannot remove '{path}': {e}"
 
-        if os.path.isfile(path) or os.path.islink(path):
-            try:
-                if not force:
-                    if not os.access(path, os.W_OK):
-                        confirm = input(f"rm: remove write-protected file '{path}'? [y/N] ")
-                        if confirm.lower() != "y":
-                            return None
-                if force:
-                    os.chmod(path, stat.S_IWUSR | stat.S_IRUSR)
-                os.remove(path)
-            except Exception as e:
-                return f"rm: cannot remove '{path}': {e}"
+        if not stat.S_ISDIR(st.st_mode):
+            return remove_file(path, st)
 
-        elif os.path.isdir(path):
-            if not recursive:
-                return f"rm: cannot remove '{path}': Is a directory"
-            try:
-                # Recursively delete contents
-                for entry in os.listdir(path):
-                    entry_path = os.path.join(path, entry)
-                    err = remove_path(entry_path)
-                    if err:
-                        return err
-                os.rmdir(path)
-            except Exception as e:
-                return f"rm: cannot remove '{path}': {e}"
+        if not recursive:
+            return f"rm: cannot remove '{path}': Is a directory"
+        return remove_tree(path)
 
-        return None
     for path in params:
         err = remove_path(path)
         if err:
@@ -288,16 +451,68 @@ def cat(parts):
     contents = []
     errors = []
 
+    # Single file straight into a redirect: let the kernel copy it
+    if redirect_file and input_data is None and len(params) == 1 and params[0] != "-":
+        file = params[0]
+        try:
+            with open(file, "rb") as src, open(redirect_file, "wb") as dst:
+                size = os.fstat(src.fileno()).st_size
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            return {"output": None, "error": None}
+        except FileNotFoundError:
+            return {"output": None, "error": f"cat: {file}: No such file or directory"}
+        except PermissionError:
+            return {"output": None, "error": f"cat: {file}: Permission denied"}
+        except Exception as e:
+            return {"output": None, "error": f"cat: {file}: {e}"}
+
+    # With a redirect, each source is copied through a 64KB-buffered file instead of joined.
+    # The file is opened on the first write, so a cat with no readable source leaves it
+    # untouched, and sources are separated by "\n" exactly as the join would
+    out = None
+    write_error = None
+    wrote = False
+
+    def start_source():
+        """Get the redirect file ready for the next source; False if it can't be written"""
+        nonlocal out, write_error, wrote
+        if write_error is not None:
+            return False
+        if out is None:
+            try:
+                out = open(redirect_file, "w", buffering=1 << 16)
+            except Exception as e:
+                write_error = e
+                return False
+        if wrote:
+            out.write("\n")
+        wrote = True
+        return True
+
+    def emit_text(text):
+        if not redirect_file:
+            contents.append(text)
+        elif start_source():
+            out.write(text)
+
     if input_data:
-        contents.append(input_data)
+        emit_text(input_data)
     for file in params:
         if file == "-":
             if input_data:
-                contents.append(input_data)
+                emit_text(input_data)
             continue
         try:
             with open(file, "r") as f:
-                contents.append(f.read())
+                if not redirect_file:
+                    contents.append(f.read())
+                elif start_source():
+                    shutil.copyfileobj(f, out, 1 << 16)
         except FileNotFoundError:
             errors.append(f"cat: {file}: No such file or directory")
         except PermissionError:
@@ -306,16 +521,16 @@ def cat(parts):
             errors.append(f"cat: {file}: {e}")
 
     output = "\n".join(contents) if contents else None
-    error = "\n".join(errors) if errors else None
 
-    if redirect_file and output is not None:
+    if out is not None:
         try:
-            with open(redirect_file, "w") as f:
-                f.write(output)
-            output = None
+            out.close()
         except Exception as e:
-            error = f"cat: cannot write to {redirect_file}: {e}"
+            errors.append(f"cat: cannot write to {redirect_file}: {e}")
+    if write_error is not None:
+        errors.append(f"cat: cannot write to {redirect_file}: {write_error}")
 
+    error = "\n".join(errors) if errors else None
     return {"output": output, "error": error}
 
 
@@ -346,21 +561,45 @@ def head(parts):
     output_lines = []
     errors = []
 
-    def process_content(name, content):
-        lines = content.splitlines()
+    # With a redirect, lines go straight to a 64KB-buffered file instead of a joined string;
+    # it is opened on the first line, so a head with no output leaves the file untouched
+    out = None
+    write_error = None
+
+    def emit(line):
+        nonlocal out, write_error
+        if not redirect_file:
+            output_lines.append(line)
+            return
+        if out is None and write_error is None:
+            try:
+                out = open(redirect_file, "w", buffering=1 << 16)
+            except Exception as e:
+                write_error = e
+        if out is not None:
+            out.write(line)
+            out.write("\n")
+
+    def process_lines(name, lines):
         if len(params) > 1:
             header = f"==> {name} <=="
-            output_lines.append(header)
-        output_lines.extend(lines[:n])
+            emit(header)
+        for line in lines:
+            emit(line)
 
     if input_data:
-        process_content("stdin", input_data)
+        process_lines("stdin", input_data.splitlines()[:n])
 
     for file in params:
         try:
             with open(file, "r") as f:
-                content = f.read()
-            process_content(file, content)
+                if n >= 0:
+                    # Stop reading after the first n lines instead of loading the whole file
+                    lines = [line.rstrip("\r\n") for line in islice(f, n)]
+                else:
+                    # -n -N prints all but the last N lines, which needs the whole file
+                    lines = f.read().splitlines()[:n]
+            process_lines(file, lines)
         except FileNotFoundError:
             errors.append(f"head: cannot open '{file}' for reading: No such file or directory")
         except PermissionError:
@@ -369,16 +608,16 @@ def head(parts):
             errors.append(f"head: {file}: {e}")
 
     output = "\n".join(output_lines) if output_lines else None
-    error = "\n".join(errors) if errors else None
 
-    if redirect_file and output is not None:
+    if out is not None:
         try:
-            with open(redirect_file, "w") as f:
-                f.write(output)
-            output = None
+            out.close()
         except Exception as e:
-            error = f"head: cannot write to {redirect_file}: {e}"
+            errors.append(f"head: cannot write to {redirect_file}: {e}")
+    if write_error is not None:
+        errors.append(f"head: cannot write to {redirect_file}: {write_error}")
 
+    error = "\n".join(errors) if errors else None
     return {"output": output, "error": error}
 
 
@@ -446,12 +685,55 @@ def tail(parts):
     if n < 0:
         return {"output": None, "error": f"tail: invalid number of lines: {n}"}
 
+    def read_last_lines(fname):
+        # Read backwards from EOF, doubling the window until it holds n full lines
+        if n == 0:
+            return []
+        with open(fname, "rb") as f:
+            if not f.seekable():
+                # Pipes/FIFOs can't be read backwards; keep only the last n lines as they stream by
+                last = deque(f, maxlen=n)
+                return [line.decode("utf-8", errors="replace").rstrip("\r\n") for line in last]
+            end = f.seek(0, os.SEEK_END)
+            start = end
+            block = 64 * 1024
+            data = b""
+            while start > 0 and data.count(b"\n") <= n:
+                start = max(0, start - block)
+                f.seek(start)
+                data = f.read(end - start)
+                block *= 2
+        lines = data.decode("utf-8", errors="replace").splitlines()
+        if start > 0:
+            lines = lines[1:]  # first line of the window is only partial
+        return lines[-n:]
+
     output_lines = []
     errors = []
 
+    # With a redirect, lines go straight to a 64KB-buffered file instead of a joined string;
+    # it is opened on the first line, so a tail with no output leaves the file untouched
+    out = None
+    write_error = None
+
+    def emit(line):
+        nonlocal out, write_error
+        if not redirect_file:
+            output_lines.append(line)
+            return
+        if out is None and write_error is None:
+            try:
+                out = open(redirect_file, "w", encoding="utf-8", buffering=1 << 16)
+            except Exception as e:
+                write_error = e
+        if out is not None:
+            out.write(line)
+            out.write("\n")
+
     if input_data is not None:
         lines = input_data.splitlines()
-        output_lines.extend(lines[-n:] if n > 0 else [])
+        for line in (lines[-n:] if n > 0 else []):
+            emit(line)
     elif params:
         for fname in params:
             try:
@@ -462,11 +744,11 @@ def tail(parts):
                         errors.append(f"tail: cannot open '{fname}' for reading: No such file")
                         continue
                 else:
-                    with open(fname, "r", encoding="utf-8", errors="replace") as f:
-                        lines = f.read().splitlines()
+                    lines = read_last_lines(fname)
                 if len(params) > 1:
-                    output_lines.append(f"==> {fname} <==")
-                output_lines.extend(lines[-n:] if n > 0 else [])
+                    emit(f"==> {fname} <==")
+                for line in (lines[-n:] if n > 0 else []):
+                    emit(line)
             except FileNotFoundError:
                 errors.append(f"tail: cannot open '{fname}' for reading: No such file")
             except PermissionError:
@@ -476,20 +758,29 @@ def tail(parts):
     else:
         return {"output": None, "error": "tail: missing input"}
 
-    output = "\n".join(output_lines)
+    output = None if redirect_file else "\n".join(output_lines)
 
-    if redirect_file and output:
+    if out is not None:
         try:
-            with open(redirect_file, "w", encoding="utf-8") as f:
-                f.write(output)
-            output = None
+            out.close()
         except Exception as e:
             errors.append(f"tail: cannot write to {redirect_file}: {e}")
+    if write_error is not None:
+        errors.append(f"tail: cannot write to {redirect_file}: {write_error}")
 
     error = "\n".join(errors) if errors else None
     return {"output": output, "error": error}
 
 
+# Key -> action table for the less pager
+_LESS_ACTIONS = {
+    "q": "quit", "\x03": "quit",
+    "j": "down", "\x1b[B": "down", "\r": "down", "\n": "down",
+    "k": "up", "\x1b[A": "up",
+    " ": "page_down",
+    "b": "page_up",
+}
+
 def less(parts):
     params = parts.get("params") or []
     input_data = parts.get("input") or None
@@ -538,27 +829,31 @@ def less(parts):
     total_lines = len(lines)
 
     while True:
-        os.system("clear")
         page = lines[pos:pos + page_size]
-        print("".join(page), end="")
-        print(f"\n--Lines {pos+1}-{min(pos+page_size,total_lines)} of {total_lines}--", end="", flush=True)
+        # Clear screen, page and status line go out as a single write
+        sys.stdout.write(
+            CLEAR_SEQ
+            + "".join(page)
+            + f"\n--Lines {pos+1}-{min(pos+page_size,total_lines)} of {total_lines}--"
+        )
+        sys.stdout.flush()
 
-        char = getch()
+        action = _LESS_ACTIONS.get(getch())
 
-        if char in ("q", "\x03"):
+        if action == "quit":
             break
-        elif char in ("j", "\x1b[B", "\r", "\n"):
+        elif action == "down":
             if pos + 1 < total_lines:
                 pos += 1
-        elif char in ("k", "\x1b[A"):
+        elif action == "up":
             if pos > 0:
                 pos -= 1
-        elif char == " ":
+        elif action == "page_down":
             if pos + page_size < total_lines:
                 pos += page_size
             else:
                 pos = total_lines - 1
-        elif char == "b":
+        elif action == "page_up":
             pos = max(0, pos - page_size)
 
     return {"output": None, "error": None}
@@ -614,34 +909,38 @@ def grep(parts):
     matches = []
     matched_files = set()
 
-    # Helper to test if a line matches
-    def line_matches(line):
-        test_line = line.lower() if ignore_case else line
-        test_pattern = pattern.lower() if ignore_case else pattern
-        matched = test_pattern in test_line
-        return not matched if invert else matched
+    # Lowercase the pattern once and the text once per source, not once per line
+    needle = pattern.lower() if ignore_case else pattern
+
+    # Helper to yield the original lines of text that match
+    def matching_lines(text):
+        lines = text.splitlines()
+        test_lines = text.lower().splitlines() if ignore_case else lines
+        for line, test_line in zip(lines, test_lines):
+            if (needle in test_line) != invert:
+                yield line
 
     # If piped input exists
     if input_data:
-        for line in input_data.splitlines():
-            if line_matches(line):
-                matches.append(line)
+        matches.extend(matching_lines(input_data))
 
     # If files are specified
     for fname in files:
         try:
             with open(fname, "r") as f:
-                file_lines = f.readlines()
-                file_match_count = 0
-                for line in file_lines:
-                    if line_matches(line):
-                        file_match_count += 1
-                        if not count_only and not list_files:
-                            matches.append(line.rstrip("\n"))
-                if count_only:
-                    matches.append(f"{file_match_count}")
-                if list_files and file_match_count > 0:
+                text = f.read()
+            if list_files:
+                # Only need to know whether anything matches at all
+                if invert:
+                    found = next(matching_lines(text), None) is not None
+                else:
+                    found = needle in (text.lower() if ignore_case else text)
+                if found:
                     matched_files.add(fname)
+            elif count_only:
+                matches.append(f"{sum(1 for _ in matching_lines(text))}")
+            else:
+                matches.extend(matching_lines(text))
         except FileNotFoundError:
             errors.append(f"grep: {fname}: No such file")
         except Exception as e:
@@ -671,7 +970,8 @@ def clear(parts=None):
         if os.name == "nt":
             os.system("cls")
         else:
-            os.system("clear")
+            sys.stdout.write(CLEAR_SEQ)
+            sys.stdout.flush()
         return {"output": None, "error": None}
     except Exception as e:
         return {"output": None, "error": f"clear: {e}"}
@@ -713,36 +1013,27 @@ def wc(parts):
 
 
 def get_counts(text, flags):
-    lines = text.splitlines()
-    words = text.split()
-    chars = text
-    
+    # Each count is only computed when asked for; lines are counted without splitting
     if not flags:
-        return str(len(words))
+        return str(len(text.split()))
         
     results = []
     if "w" in flags:
-        results.append(str(len(words)))
+        results.append(str(len(text.split())))
     if "l" in flags:
-        results.append(str(len(lines)))
+        lines = text.count("\n") + (1 if text and not text.endswith("\n") else 0)
+        results.append(str(lines))
     if "c" in flags:
-        results.append(str(len(chars)))
+        results.append(str(len(text)))
     return " ".join(results)
 
-def history(parts):
+def history(parts, cmd_history):
     params = parts.get("params", [])
     redirect_file = parts.get("redirect", None)
     errors = []
-    output = None
     
-    try: 
-        result = subprocess.run("history",shell = True, capture_output = True, text = True)
-        output = result.stdout.strip()
-        if result.stderr:
-            errors.append(result.stderr.strip())
-    except Exception as err:
-        errors.append(f"history: {err}")
-        output = None
+    # The shell already keeps its history in memory, no need to spawn one
+    output = "\n".join(f"{i + 1} {c}" for i, c in enumerate(cmd_history))
             
     if redirect_file and output:
         try:
@@ -755,6 +1046,51 @@ def history(parts):
     error = "\n".join(errors) if errors else None
     return {"output": output, "error" : error}
 
+def apply_symbolic_mode(mode, current):
+    """Applies a symbolic mode like 'u+x' or 'go-w,a+r' to the current permission bits."""
+    who_bits = {
+        "u": stat.S_IRWXU | stat.S_ISUID,
+        "g": stat.S_IRWXG | stat.S_ISGID,
+        "o": stat.S_IRWXO | stat.S_ISVTX,
+    }
+    who_bits["a"] = who_bits["u"] | who_bits["g"] | who_bits["o"]
+    perm_bits = {
+        "r": stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH,
+        "w": stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH,
+        "x": stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH,
+        "s": stat.S_ISUID | stat.S_ISGID,
+        "t": stat.S_ISVTX,
+    }
+
+    for clause in mode.split(","):
+        i = 0
+        who = 0
+        while i < len(clause) and clause[i] in who_bits:
+            who |= who_bits[clause[i]]
+            i += 1
+        if not who:
+            who = who_bits["a"]
+        if i == len(clause):
+            raise ValueError(f"invalid mode: '{mode}'")
+
+        while i < len(clause):
+            op = clause[i]
+            if op not in "+-=":
+                raise ValueError(f"invalid mode: '{mode}'")
+            i += 1
+            bits = 0
+            while i < len(clause) and clause[i] in perm_bits:
+                bits |= perm_bits[clause[i]]
+                i += 1
+            bits &= who
+            if op == "+":
+                current |= bits
+            elif op == "-":
+                current &= ~bits
+            else:
+                current = (current & ~who) | bits
+    return current
+
 def chmod(parts):
     params = parts.get("params", [])
     redirect_file = parts.get("redirect",None)
@@ -766,7 +1102,12 @@ def chmod(parts):
             
     m,f = params[:2]
     try:
-        subprocess.run(["chmod", m, f])
+        # Set the bits directly with os.chmod instead of running /usr/bin/chmod
+        if m.isdigit():
+            new_mode = int(m, 8)
+        else:
+            new_mode = apply_symbolic_mode(m, stat.S_IMODE(os.stat(f).st_mode))
+        os.chmod(f, new_mode)
         output = f"permissions for {f} are set to {m}"
     except Exception as err:
         errors.append(f"chmod: {err}")
@@ -797,12 +1138,13 @@ def sorting(parts):
     for file in params:
         try:
            with open(file, "r") as f:
-                    contents.extend(f.readlines())
+                    contents.extend(f.read().splitlines())
         except Exception as err:
             errors.append(f"sort:{file}: {err}")
                 
     try:
-            output = "\n".join(sorted([line.strip() for line in contents]))
+            contents.sort()  # in place, lines already have no trailing newline
+            output = "\n".join(contents)
     except Exception as err:
         errors.append(f"sort: {err}")
         output = None
@@ -877,10 +1219,23 @@ def mv(parts):
     if not os.path.exists(source_path):
         return f"Source file does not exist: {source_path}"
 
+    #If destination is a directory the file is moved into it
+    target_path = dest_path
+    if os.path.isdir(dest_path):
+        target_path = os.path.join(dest_path, os.path.basename(source_path.rstrip("/")))
+        #os.replace would overwrite a file of the same name there; refuse like shutil.move does
+        if os.path.exists(target_path):
+            return {"output": None, "error": f"Error moving file: Destination path '{target_path}' already exists"}
+
     try:
-        #Moving the file from src to dest
-        shutil.move(source_path, dest_path) #It automatically overwrites the file if destination is an existing 
-                                         #file or if destination is a directory it moves the file to the directory 
+        #Same filesystem: a single rename, no matter how big the file is
+        try:
+            os.replace(source_path, target_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            #Different filesystems: shutil.move falls back to copy + delete
+            shutil.move(source_path, dest_path)
         output = f"Moved '{source_file}' to '{dest_path}'."
     except Exception as e:
         error = f"Error moving file: {str(e)}"
@@ -901,23 +1256,16 @@ def cd(parts):
     if not params:
         target = os.path.expanduser("~")
     else:
+        # "/", ".." and relative paths are all resolved by chdir itself
         target = params[0]
 
-        if target == "/":  # go root
-            target = "/"
-        elif target == "..":  # go parent
-            target = os.path.dirname(os.getcwd())
-        elif not os.path.isabs(target):  # relative path
-            target = os.path.join(os.getcwd(), target)
-
-    if os.path.isdir(target):
-        try:
-            os.chdir(target)
-            return {"output": f"Changed directory to: {target}", "error": None}
-        except Exception as err:
-            return {"output": None, "error": f"cd: {err}"}
-    else:
+    try:
+        os.chdir(target)
+        return {"output": f"Changed directory to: {os.getcwd()}", "error": None}
+    except (FileNotFoundError, NotADirectoryError):
         return {"output": None, "error": f"cd: no such directory: {target}"}
+    except Exception as err:
+        return {"output": None, "error": f"cd: {err}"}
 
 
 
@@ -958,187 +1306,262 @@ def randomline(parts):
         except ValueError:
             return {"output": None, "error": f"randomline: invalid number in flag '{flags}'"}
 
-    lines = []
-
-    # Collect input
-    if input_data:
-        lines.extend(input_data.splitlines())
-    for file in params:
-        try:
+    # Reservoir sample: tag every line with a random key and keep the num_lines
+    # largest keys in a min-heap, so only num_lines lines are ever held in memory
+    reservoir = []
+    seen = 0
+
+    def offer(line):
+        r = random.random()
+        if len(reservoir) < num_lines:
+            heapq.heappush(reservoir, (r, line))
+        elif reservoir and r > reservoir[0][0]:
+            heapq.heapreplace(reservoir, (r, line))
+
+    # Piped input and every file feed one lazy stream of lines; nothing is split up front
+    current_file = None
+
+    def source_lines():
+        nonlocal current_file
+        if input_data:
+            yield from io.StringIO(input_data)
+        for file in params:
+            current_file = file
             with open(file, "r") as f:
-                lines.extend(f.read().splitlines())
-        except Exception as e:
-            return {"output": None, "error": f"randomline: {file}: {e}"}
+                yield from f
 
-    if not lines:
-        return {"output": None, "error": "randomline: no input provided"}
+    try:
+        for line in source_lines():
+            offer(line.rstrip("\n"))
+            seen += 1
+    except Exception as e:
+        return {"output": None, "error": f"randomline: {current_file}: {e}"}
 
-    # Pick random lines
-    if num_lines > len(lines):
-        num_lines = len(lines)
+    if not seen:
+        return {"output": None, "error": "randomline: no input provided"}
 
-    output_lines = random.sample(lines, num_lines)
-    output = "\n".join(output_lines)
+    # Heap order follows the keys, not a random order, so shuffle the picked lines
+    chosen = [line for _, line in reservoir]
+    random.shuffle(chosen)
+    output = "\n".join(chosen)
 
     return {"output": output, "error": None}
 
-if __name__ == "__main__":
-    cmd_history = load_history()
-    history_index = len(cmd_history)
-    cmd = ""
-    cursor_pos = 0
-
-    print_cmd(cmd, cursor_pos)
+# command name -> function, looked up once per command instead of an elif chain
+DISPATCH = {
+    "ls": ls,
+    "cat": cat,
+    "grep": grep,
+    "tail": tail,
+    "head": head,
+    "less": less,
+    "rm": rm,
+    "cp": cp,
+    "pwd": pwd_cmd,
+    "mv": mv,
+    "cd": cd,
+    "mkdir": mkdir,
+    "clear": clear,
+    "chmod": chmod,
+    "sort": sorting,
+    "wc": wc,
+    "randomline": randomline,
+}
+
+
+def run_line(cmd, cmd_history):
+    """Runs one submitted command line: history expansion, piping and redirect."""
+    if not cmd.strip():
+        return
+
+    if cmd.startswith("!"):
+        try:
+            num = int(cmd[1:])
+            if num <= 0 or num > len(cmd_history):
+                print(f"bash: !{num}: event not found")
+                return
+            cmd = cmd_history[num - 1]
+            print(cmd)  # echo command
+        except ValueError:
+            print(f"bash: {cmd}: event not found")
+            return
 
-    while True:
-        char = getch()
-
-        # Ctrl-C or 'exit'
-        if char == "\x03" or cmd.strip() == "exit":
-            save_history(cmd_history)  # save history before leaving
-            raise SystemExit("Bye.")
-
-        # Backspace
-        elif char == "\x7f":
-            if cursor_pos > 0:
-                cmd = cmd[:cursor_pos-1] + cmd[cursor_pos:]
-                cursor_pos -= 1
-            print_cmd(cmd, cursor_pos)
+    add_history(cmd_history, cmd)
 
-        # Arrow keys
-        elif char == "\x1b":
-            getch()
-            direction = getch()
-            if direction == "A":  # Up
-                if cmd_history and history_index > 0:
-                    history_index -= 1
-                    cmd = cmd_history[history_index]
-                    cursor_pos = len(cmd)
-                    print_cmd(cmd, cursor_pos)
-            elif direction == "B":  # Down
-                if cmd_history and history_index < len(cmd_history) - 1:
-                    history_index += 1
-                    cmd = cmd_history[history_index]
-                else:
-                    history_index = len(cmd_history)
-                    cmd = ""
-                cursor_pos = len(cmd)
-                print_cmd(cmd, cursor_pos)
-            elif direction == "C":  # Right
-                if cursor_pos < len(cmd):
-                    cursor_pos += 1
-                print_cmd(cmd, cursor_pos)
-            elif direction == "D":  # Left
-                if cursor_pos > 0:
-                    cursor_pos -= 1
-                print_cmd(cmd, cursor_pos)
-
-        # Enter pressed
-        elif char == "\r":
-            print()  # newline
-            if not cmd.strip():
-                cmd = ""
-                cursor_pos = 0
-                print_cmd(cmd, cursor_pos)
-                continue
+    # run commands
+    command_list = parse_cmd(cmd)
+    piped_input = None
+    final_output = None
 
-            if cmd.startswith("!"):
-                try:
-                    num = int(cmd[1:])
-                    if num <= 0 or num > len(cmd_history):
-                        print(f"bash: !{num}: event not found")
-                        cmd, cursor_pos = "", 0
-                        print_cmd(cmd, cursor_pos)
-                        continue
-                    cmd = cmd_history[num - 1]
-                    print(cmd)  # echo command
-                except ValueError:
-                    print(f"bash: {cmd}: event not found")
-                    cmd, cursor_pos = "", 0
-                    print_cmd(cmd, cursor_pos)
-                    continue
+    for command in command_list:
+        if piped_input is not None:
+            command["input"] = piped_input
 
-            cmd_history.append(cmd)
-            history_index = len(cmd_history)
-            save_history(cmd_history)
+        c = command['cmd']
+        try:
+            if c == "history":  # the only command that needs the session history
+                output = history(command, cmd_history)
+            else:
+                handler = DISPATCH.get(c)
+                if handler:
+                    output = handler(command)
+                else:
+                    output = {"output": None, "error": f"{c}: command not found"}
+        except Exception as e:
+            output = {"output": None, "error": str(e)}
 
-            # run commands
-            command_list = parse_cmd(cmd)
+        if output["error"]:
+            print(output["error"])
             piped_input = None
             final_output = None
+        else:
+            piped_input = output["output"]
+            final_output = output
 
-            for command in command_list:
-                if piped_input is not None:
-                    command["input"] = piped_input
+    redirect_file = command_list[-1].get("redirect")
+    if redirect_file and final_output and final_output.get("output"):
+        try:
+            with open(redirect_file, "w") as f:
+                f.write(final_output["output"])
+            final_output["output"] = None
+        except Exception as e:
+            print(f"Error writing to file {redirect_file}: {e}")
 
-                c = command['cmd']
-                try:
-                    if c == "ls":
-                        output = ls(command)
-                    elif c == "cat":
-                        output = cat(command)
-                    elif c == "grep":
-                        output = grep(command)
-                    elif c == "tail":
-                        output = tail(command)
-                    elif c == "head":
-                        output = head(command)
-                    elif c == "less":
-                        output = less(command)
-                    elif c == "rm":
-                        output = rm(command)
-                    elif c == "cp":
-                        output = cp(command)
-                    elif c == "pwd":
-                        output = pwd_cmd(command)
-                    elif c == "mv":
-                        output = mv(command)
-                    elif c == "cd":
-                        output = cd(command)
-                    elif c == "mkdir":
-                        output = mkdir(command)
-                    elif c == "clear":
-                        output = clear(command)
-                    elif c == "history":
-                        hist_out = "\n".join(f"{i + 1} {c}" for i, c in enumerate(cmd_history))
-                        output = {"output": hist_out, "error": None}
-                    elif c == "chmod":
-                        output = chmod(command)
-                    elif c == "sort":
-                        output = sorting(command)
-                    elif c == "wc":
-                        output = wc(command)
-                    elif c == "randomline":
-                        output = randomline(command)
-                    else:
-                        output = {"output": None, "error": f"{c}: command not found"}
-                except Exception as e:
-                    output = {"output": None, "error": str(e)}
+    if final_output and final_output.get("output"):
+        print(final_output["output"])
 
-                if output["error"]:
-                    print(output["error"])
-                    piped_input = None
-                    final_output = None
-                else:
-                    piped_input = output["output"]
-                    final_output = output
 
-            redirect_file = command_list[-1].get("redirect")
-            if redirect_file and final_output and final_output.get("output"):
-                try:
-                    with open(redirect_file, "w") as f:
-                        f.write(final_output["output"])
-                    final_output["output"] = None
-                except Exception as e:
-                    print(f"Error writing to file {redirect_file}: {e}")
+def read_batch():
+    """Blocks for the next keypress, then drains whatever else is already
+    waiting (a paste, key repeat) so the whole burst costs one redraw."""
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setraw(fd)
+        data = os.read(fd, 4096)
+        while select.select([fd], [], [], 0)[0]:
+            more = os.read(fd, 4096)
+            if not more:
+                break
+            data += more
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+    return data
+
+
+def split_keys(data):
+    """Splits raw input into keys: arrow escape sequences, single control
+    characters, and runs of printable text (inserted in one splice)."""
+    keys = []
+    i = 0
+    while i < len(data):
+        ch = data[i]
+        if ch == "\x1b" and data[i + 1:i + 2] == "[" and i + 2 < len(data):
+            keys.append(data[i:i + 3])
+            i += 3
+        elif ch.isprintable():
+            j = i + 1
+            while j < len(data) and data[j].isprintable():
+                j += 1
+            keys.append(data[i:j])
+            i = j
+        else:
+            keys.append(ch)
+            i += 1
+    return keys
 
-            if final_output and final_output.get("output"):
-                print(final_output["output"])
 
-            cmd = ""
-            cursor_pos = 0
-            print_cmd(cmd, cursor_pos)
+def key_batches():
+    """Yields the keys of each input batch. The UTF-8 decoder and an escape
+    sequence cut off by the end of a read carry over to the next batch, so a
+    key split across two reads still arrives as one key."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    while True:
+        data = pending + decoder.decode(read_batch())
+        if data.endswith("\x1b"):
+            data, pending = data[:-1], data[-1:]
+        elif data.endswith("\x1b["):
+            data, pending = data[:-2], data[-2:]
         else:
-            cmd = cmd[:cursor_pos] + char + cmd[cursor_pos:]
+            pending = ""
+        yield split_keys(data)
+
+
+def handle_key(key, cmd, cursor_pos, history_index, cmd_history):
+    """Applies one editing key to the line being typed.
+    Returns the new (cmd, cursor_pos, history_index)."""
+    # Backspace
+    if key == "\x7f":
+        if cursor_pos > 0:
+            cmd = cmd[:cursor_pos-1] + cmd[cursor_pos:]
+            cursor_pos -= 1
+
+    # Arrow keys
+    elif key == "\x1b[A":  # Up
+        if cmd_history and history_index > 0:
+            history_index -= 1
+            cmd = cmd_history[history_index]
+            cursor_pos = len(cmd)
+    elif key == "\x1b[B":  # Down
+        if cmd_history and history_index < len(cmd_history) - 1:
+            history_index += 1
+            cmd = cmd_history[history_index]
+        else:
+            history_index = len(cmd_history)
+            cmd = ""
+        cursor_pos = len(cmd)
+    elif key == "\x1b[C":  # Right
+        if cursor_pos < len(cmd):
             cursor_pos += 1
-            print_cmd(cmd, cursor_pos)
\ No newline at end of file
+    elif key == "\x1b[D":  # Left
+        if cursor_pos > 0:
+            cursor_pos -= 1
+    elif key.startswith("\x1b"):
+        pass  # other escape sequences are ignored
+
+    # Anything else is typed text
+    else:
+        cmd = cmd[:cursor_pos] + key + cmd[cursor_pos:]
+        cursor_pos += len(key)
+
+    return cmd, cursor_pos, history_index
+
+
+if __name__ == "__main__":
+    cmd_history = load_history()
+    open_history()
+    atexit.register(save_history, cmd_history)  # whatever flush_history held back
+    history_index = len(cmd_history)
+    cmd = ""
+    cursor_pos = 0
+
+    print_cmd(cmd, cursor_pos)
+    drawn = (cmd, cursor_pos)  # what the terminal line currently shows
+
+    for keys in key_batches():
+        for key in keys:
+            # Ctrl-C or 'exit'
+            if key == "\x03" or cmd.strip() == "exit":
+                raise SystemExit("Bye.")  # atexit saves the history
+
+            # Enter pressed
+            elif key == "\r":
+                print_cmd(cmd)  # show the submitted line, it may not be drawn yet
+                print()  # newline
+                run_line(cmd, cmd_history)
+                history_index = len(cmd_history)
+                cmd = ""
+                cursor_pos = 0
+                drawn = None  # command output moved us off the prompt line
+
+            else:
+                cmd, cursor_pos, history_index = handle_key(
+                    key, cmd, cursor_pos, history_index, cmd_history
+                )
+
+        # Redraw once per batch of keys, and only if the keys changed anything
+        # (e.g. Left at column 0 or Up at the oldest entry are no-ops)
+        if (cmd, cursor_pos) != drawn:
+            print_cmd(cmd, cursor_pos)
+            drawn = (cmd, cursor_pos)
@@ -5,9 +5,30 @@ from pathlib import Path
 import datetime
 import sys
 import os
+import functools
+from itertools import accumulate
+from operator import itemgetter
+
+# NumPy is optional: draws every process's burst randomness in a few vectorized calls,
+# falls back to one random draw per value
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# orjson is optional: much faster serializer, falls back to the stdlib json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 pid = 0
 
+JOB_JSON_DIR = Path("../job_jsons")  # default destination for save_to_file
+_created_dirs = set()                # directories save_to_file has already made
+
 # ----------------------------------------------------------
 # Workload presets
 # ----------------------------------------------------------
@@ -58,21 +79,20 @@ def generate_timestamp():
 # ----------------------------------------------------------
 def generate_outfile_id():
     """Generate next file number for saving to disk"""
-    try:
-        with open("fid", "r") as f:
-            fid = int(f.read().strip())
-        new_fid = fid + 1
-    except FileNotFoundError:
-        new_fid = 1
-
-    with open("fid", "w") as f:
+    # O_CREAT covers the first run, so the counter is read and rewritten
+    # through a single open
+    with open(os.open("fid", os.O_RDWR | os.O_CREAT, 0o644), "r+") as f:
+        new_fid = int(f.read().strip() or 0) + 1
+        f.seek(0)
+        f.truncate()
         f.write(str(new_fid))
-    return str(new_fid).zfill(4)
+    return f"{new_fid:04d}"
 
 
 # ----------------------------------------------------------
+@functools.lru_cache(maxsize=4)
 def load_user_classes(file_path="job_classes.json"):
-    """Load job classes with multiple fallback paths"""
+    """Load job classes with multiple fallback paths (parsed once per file_path)"""
     # Try multiple possible locations
     possible_paths = [
         file_path,  # Current directory
@@ -83,12 +103,11 @@ def load_user_classes(file_path="job_classes.json"):
     ]
 
     for path in possible_paths:
-        try:
-            with open(path, "r") as f:
-                print(f"Loading job classes from: {path}")
-                return json.load(f)
-        except FileNotFoundError:
+        if not os.path.isfile(path):
             continue
+        with open(path, "r") as f:
+            print(f"Loading job classes from: {path}")
+            return json.load(f)
 
     # If we get here, file wasn't found
     print(f"Error: Could not find {file_path} in any of these locations:")
@@ -98,57 +117,65 @@ def load_user_classes(file_path="job_classes.json"):
 
 
 # ----------------------------------------------------------
-def generate_cpu_burst(user_class):
-    return max(
-        1,
-        int(random.gauss(user_class["cpu_burst_mean"], user_class["cpu_burst_stddev"])),
-    )
+# Time quantum choices per process class
+QUANTUM_CHOICES = {
+    "B": (2, 3, 4),     # Interactive users
+    "C": (3, 4, 5),     # Network users
+    "A": (4, 5, 6),     # Disk-heavy users
+    "D": (5, 6, 7, 8),  # Mixed/batch users
+}
 
 
-# ----------------------------------------------------------
-def generate_io_burst(user_class):
-    io_type = random.choice(user_class["io_profile"]["io_types"])
-    duration = max(
-        1,
-        int(
-            random.gauss(
-                user_class["io_profile"]["io_duration_mean"],
-                user_class["io_profile"]["io_duration_stddev"],
-            )
-        ),
-    )
-    return {"type": io_type, "duration": duration}
+def generate_quantum(user_class, rng=random):
+    """Generate time quantum based on process class"""
+    choices = QUANTUM_CHOICES.get(user_class["class_id"])
+    if choices is None:
+        return 4
+    return rng.choice(choices)
 
 
 # ----------------------------------------------------------
-def generate_quantum(user_class):
-    """Generate time quantum based on process class"""
-    class_id = user_class["class_id"]
-
-    if class_id == "B":  # Interactive users
-        return random.choice([2, 3, 4])
-    elif class_id == "C":  # Network users
-        return random.choice([3, 4, 5])
-    elif class_id == "A":  # Disk-heavy users
-        return random.choice([4, 5, 6])
-    elif class_id == "D":  # Mixed/batch users
-        return random.choice([5, 6, 7, 8])
-    else:
-        return 4
+def draw_burst_tables(classes, workload_preset=None, max_bursts=20, rng=None):
+    """Pre-draw every random value the burst loop can use, for a batch of processes.
+
+    classes[i] is the user class of process i. Returns four row-per-process
+    lists (cpu burst lengths, io durations, io-ratio rolls, io-type picks),
+    each max_bursts long, made with one NumPy call per quantity instead of
+    one random.gauss call per burst. Needs NumPy; without it generate_process
+    draws each value as the burst loop reaches it.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    burst_mult = workload_preset["burst_length_multiplier"] if workload_preset else 1.0
+    shape = (len(classes), max_bursts)
+
+    cpu_mean = np.array([c["cpu_burst_mean"] for c in classes], dtype=float)[:, None]
+    cpu_std = np.array([c["cpu_burst_stddev"] for c in classes], dtype=float)[:, None]
+    io_mean = np.array([c["io_profile"]["io_duration_mean"] for c in classes], dtype=float)[:, None]
+    io_std = np.array([c["io_profile"]["io_duration_stddev"] for c in classes], dtype=float)[:, None]
+
+    # same rounding as max(1, int(gauss(...))): truncate toward zero, floor at 1
+    cpu = np.maximum(1, ((cpu_mean + cpu_std * rng.standard_normal(shape)) * burst_mult).astype(np.int64))
+    io_dur = np.maximum(1, (io_mean + io_std * rng.standard_normal(shape)).astype(np.int64))
+    io_roll = rng.random(shape)
+    io_pick = rng.random(shape)
+
+    # plain lists: indexing a Python list is much cheaper than indexing an ndarray
+    return cpu.tolist(), io_dur.tolist(), io_roll.tolist(), io_pick.tolist()
 
 
 # ----------------------------------------------------------
-def generate_process(user_class, workload_preset=None, max_bursts=20):
+def generate_process(user_class, workload_preset=None, max_bursts=20, draws=None, rng=random):
     global pid
 
     pid += 1
     ppid = str(pid)
 
     prio_low, prio_high = user_class["priority_range"]
-    priority = random.randint(prio_low, prio_high)
+    priority = rng.randint(prio_low, prio_high)
 
     # Generate quantum
-    quantum = generate_quantum(user_class)
+    quantum = generate_quantum(user_class, rng)
 
     # Apply workload preset adjustments if provided
     if workload_preset:
@@ -160,17 +187,32 @@ def generate_process(user_class, workload_preset=None, max_bursts=20):
 
     budget_mean = user_class.get("cpu_budget_mean", 50) * burst_mult
     budget_std = user_class.get("cpu_budget_stddev", 10)
-    cpu_budget = max(5, int(random.gauss(budget_mean, budget_std)))
+    cpu_budget = max(5, int(rng.gauss(budget_mean, budget_std)))
+
+    # Random values for this process's bursts: one row of draw_burst_tables, or, without
+    # one, scalar rng calls made only for the bursts the loop actually builds
+    if draws is not None:
+        cpu_draws, io_dur_draws, io_roll_draws, io_pick_draws = draws
+    else:
+        gauss, roll = rng.gauss, rng.random
+        cpu_mean, cpu_std = user_class["cpu_burst_mean"], user_class["cpu_burst_stddev"]
+        io_mean = user_class["io_profile"]["io_duration_mean"]
+        io_std = user_class["io_profile"]["io_duration_stddev"]
+
+    io_types = user_class["io_profile"]["io_types"]
+    base_io_ratio = user_class["io_profile"]["io_ratio"]
+    adjusted_io_ratio = min(0.95, base_io_ratio * io_ratio_mult)
 
     bursts = []
     cpu_used = 0
     burst_count = 0
 
     while cpu_used < cpu_budget and burst_count < max_bursts:
-        # CPU burst with workload adjustment
-        cpu_burst = max(1, int(
-            random.gauss(user_class["cpu_burst_mean"], user_class["cpu_burst_stddev"]) * burst_mult
-        ))
+        # CPU burst with workload adjustment (already applied in a table draw)
+        if draws is not None:
+            cpu_burst = cpu_draws[burst_count]
+        else:
+            cpu_burst = max(1, int(gauss(cpu_mean, cpu_std) * burst_mult))
         if cpu_used + cpu_burst > cpu_budget:
             cpu_burst = cpu_budget - cpu_used
         bursts.append({"cpu": cpu_burst})
@@ -179,11 +221,17 @@ def generate_process(user_class, workload_preset=None, max_bursts=20):
 
         # IO burst with workload adjustment
         if cpu_used < cpu_budget and burst_count < max_bursts:
-            base_io_ratio = user_class["io_profile"]["io_ratio"]
-            adjusted_io_ratio = min(0.95, base_io_ratio * io_ratio_mult)
-
-            if random.random() < adjusted_io_ratio:
-                bursts.append({"io": generate_io_burst(user_class)})
+            if draws is not None:
+                do_io = io_roll_draws[burst_count] < adjusted_io_ratio
+            else:
+                do_io = roll() < adjusted_io_ratio
+            if do_io:
+                if draws is not None:
+                    io_pick, io_duration = io_pick_draws[burst_count], io_dur_draws[burst_count]
+                else:
+                    io_pick, io_duration = roll(), max(1, int(gauss(io_mean, io_std)))
+                io_type = io_types[int(io_pick * len(io_types))]
+                bursts.append({"io": {"type": io_type, "duration": io_duration}})
             burst_count += 1
 
     return {
@@ -198,8 +246,13 @@ def generate_process(user_class, workload_preset=None, max_bursts=20):
 
 
 # ----------------------------------------------------------
-def generate_processes(user_classes, n=10, workload_type="standard", arrival_spacing=None):
-    """Generate multiple processes with specified workload characteristics"""
+def generate_processes(user_classes, n=10, workload_type="standard", arrival_spacing=None, rng=random):
+    """Generate multiple processes with specified workload characteristics
+
+    rng is the random.Random (or the random module) every Python-level draw
+    comes from; the NumPy generator for the burst tables is seeded from it,
+    so one seeded rng makes the whole workload reproducible.
+    """
     global pid
     pid = 0  # Reset PID counter
 
@@ -225,22 +278,36 @@ def generate_processes(user_classes, n=10, workload_type="standard", arrival_spa
     processes = []
     current_time = 0
 
+    # Select classes based on distribution: one call for all n, cumulative weights computed once
+    cum_weights = list(accumulate(weights))
+    selected = [class_lookup[cid] for cid in rng.choices(class_ids, cum_weights=cum_weights, k=n)]
+
+    # With NumPy, draw all burst randomness for every process in one go; without it each
+    # process draws its own values as it builds its bursts
+    if NUMPY_AVAILABLE:
+        np_rng = np.random.default_rng(rng.getrandbits(64))
+        draws = list(zip(*draw_burst_tables(selected, preset, rng=np_rng)))
+    else:
+        draws = [None] * n
+
     for i in range(n):
-        # Select class based on distribution
-        selected_class_id = random.choices(class_ids, weights=weights, k=1)[0]
-        user_class = class_lookup[selected_class_id]
+        user_class = selected[i]
 
         # Generate process
-        process = generate_process(user_class, preset)
+        process = generate_process(
+            user_class, preset,
+            draws=draws[i],
+            rng=rng,
+        )
 
         # Add arrival time
         process["arrival_time"] = current_time
-        current_time += max(0, int(random.gauss(arrival_spacing, arrival_spacing * 0.3)))
+        current_time += max(0, int(rng.gauss(arrival_spacing, arrival_spacing * 0.3)))
 
         processes.append(process)
 
     # Sort by arrival time
-    processes.sort(key=lambda p: p["arrival_time"])
+    processes.sort(key=itemgetter("arrival_time"))
 
     return processes, preset
 
@@ -250,13 +317,22 @@ def save_to_file(processes, filename=None):
     """Save processes to a JSON file"""
     if filename is None:
         file_num = generate_outfile_id()
-        filename = f"../job_jsons/process_file_{file_num}.json"
-
-    # Ensure directory exists
-    Path(filename).parent.mkdir(parents=True, exist_ok=True)
-
-    with open(filename, "w") as f:
-        json.dump(processes, f, indent=2)
+        filename = str(JOB_JSON_DIR / f"process_file_{file_num}.json")
+
+    # Ensure directory exists (checked once per directory per session)
+    parent = os.path.abspath(os.path.dirname(filename))
+    if parent not in _created_dirs:
+        os.makedirs(parent, exist_ok=True)
+        _created_dirs.add(parent)
+
+    if ORJSON_AVAILABLE:
+        # serialize to bytes in one call and write them in one go
+        with open(filename, "wb", buffering=1 << 20) as f:
+            f.write(orjson.dumps(processes, option=orjson.OPT_INDENT_2))
+    else:
+        # json.dump emits many small chunks; a 1MB buffer batches them into few writes
+        with open(filename, "w", buffering=1 << 20) as f:
+            json.dump(processes, f, indent=2)
 
     return filename
 
@@ -271,17 +347,20 @@ def print_summary(processes, workload_preset, filename=None):
         print(f"Saved to: {filename}")
     print('=' * 60)
 
-    # Calculate statistics
-    total_cpu = sum(p["cpu_budget"] for p in processes)
-    total_io = sum(sum(1 for b in p["bursts"] if "io" in b) for p in processes)
-    total_bursts = sum(len(p["bursts"]) for p in processes)
-    avg_arrival = sum(p["arrival_time"] for p in processes) / len(processes) if processes else 0
-
-    # Class distribution
+    # Calculate statistics and class distribution in a single pass
+    total_cpu = total_io = total_bursts = arrival_sum = 0
     class_dist = {}
     for p in processes:
+        total_cpu += p["cpu_budget"]
+        bursts = p["bursts"]
+        total_bursts += len(bursts)
+        for b in bursts:
+            if "io" in b:
+                total_io += 1
+        arrival_sum += p["arrival_time"]
         class_id = p["class_id"]
         class_dist[class_id] = class_dist.get(class_id, 0) + 1
+    avg_arrival = arrival_sum / len(processes) if processes else 0
 
     print(f"Total CPU time needed: {total_cpu}")
     print(f"Total IO bursts: {total_io}")
@@ -291,14 +370,19 @@ def print_summary(processes, workload_preset, filename=None):
 
 
 # ----------------------------------------------------------
-def generate_workload(workload_type="standard", num_processes=10, save_to_disk=False, arrival_spacing=None):
-    """Main function to generate workload and optionally save to disk"""
+def generate_workload(workload_type="standard", num_processes=10, save_to_disk=False, arrival_spacing=None, seed=None):
+    """Main function to generate workload and optionally save to disk
+
+    Pass a seed to get the same workload on every run.
+    """
     user_classes = load_user_classes("job_classes.json")
+    rng = random.Random(seed)
     processes, preset = generate_processes(
         user_classes,
         n=num_processes,
         workload_type=workload_type,
-        arrival_spacing=arrival_spacing
+        arrival_spacing=arrival_spacing,
+        rng=rng,
     )
 
     filename = None
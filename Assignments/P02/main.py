@@ -5,12 +5,18 @@ Supports workload generation on-the-fly
 
 import json
 import sys
-from rich import print
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson is optional: parses bytes directly and is much faster than json.load
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from pkg.clock import Clock
 from pkg.scheduler import Scheduler
 from pkg.process import Process
-from pkg.visualizer import Visualizer
 
 # ---------------------------------------
 # Import the generator module
@@ -30,6 +36,20 @@ except ImportError:
         print("[Warning] generate_jobs.py not found. Workload generation disabled.")
         GENERATOR_AVAILABLE = False
 
+# ---------------------------------------
+# Build Process objects from job dicts
+# ---------------------------------------
+def process_from_dict(p):
+    """Create a Process from one job dict (loaded from JSON or freshly generated)"""
+    # burst dicts are already in the shape Process expects; no need to rebuild them
+    return Process(
+        pid=p["pid"],
+        bursts=p["bursts"],
+        priority=p.get("priority", 0),
+        quantum=p.get("quantum", 4),
+        arrival_time=p.get("arrival_time", 0)
+    )
+
 # ---------------------------------------
 # Load JSON into Process objects
 # ---------------------------------------
@@ -46,9 +66,13 @@ def load_processes_from_json(filename="generated_processes.json", limit=None):
     data = None
     for path in possible_paths:
         try:
-            with open(path) as f:
-                data = json.load(f)
-                break
+            if ORJSON_AVAILABLE:
+                with open(path, "rb") as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(path) as f:
+                    data = json.load(f)
+            break
         except FileNotFoundError:
             continue
 
@@ -56,35 +80,17 @@ def load_processes_from_json(filename="generated_processes.json", limit=None):
         print(f"Error: Could not find file {filename}")
         return []
 
-    processes = []
     if limit is None or limit > len(data):
         limit = len(data)
 
-    for p in data[:limit]:
-        bursts = []
-        for b in p["bursts"]:
-            if "cpu" in b:
-                bursts.append({"cpu": b["cpu"]})
-            elif "io" in b:
-                bursts.append(
-                    {"io": {"type": b["io"]["type"], "duration": b["io"]["duration"]}}
-                )
-
-        proc = Process(
-            pid=p["pid"],
-            bursts=bursts,
-            priority=p.get("priority", 0),
-            quantum=p.get("quantum", 4),
-            arrival_time=p.get("arrival_time", 0)
-        )
-        processes.append(proc)
+    processes = [process_from_dict(p) for p in data[:limit]]
 
     return processes
 
 # ---------------------------------------
 # Generate processes on-the-fly
 # ---------------------------------------
-def generate_and_get_processes(workload_type="standard", num_processes=10, arrival_spacing=None, save_temp=False):
+def generate_and_get_processes(workload_type="standard", num_processes=10, arrival_spacing=None, save_temp=False, seed=None):
     """Generate processes dynamically based on workload type"""
     if not GENERATOR_AVAILABLE:
         print("Error: Cannot generate processes. Generator not available.")
@@ -102,29 +108,12 @@ def generate_and_get_processes(workload_type="standard", num_processes=10, arriv
         workload_type=workload_type,
         num_processes=num_processes,
         save_to_disk=save_temp,
-        arrival_spacing=arrival_spacing
+        arrival_spacing=arrival_spacing,
+        seed=seed
     )
 
     # Convert to Process objects
-    processes = []
-    for p in processes_data:
-        bursts = []
-        for b in p["bursts"]:
-            if "cpu" in b:
-                bursts.append({"cpu": b["cpu"]})
-            elif "io" in b:
-                bursts.append(
-                    {"io": {"type": b["io"]["type"], "duration": b["io"]["duration"]}}
-                )
-
-        proc = Process(
-            pid=p["pid"],
-            bursts=bursts,
-            priority=p.get("priority", 0),
-            quantum=p.get("quantum", 4),
-            arrival_time=p.get("arrival_time", 0)
-        )
-        processes.append(proc)
+    processes = [process_from_dict(p) for p in processes_data]
 
     print(f"✓ Generated {len(processes)} {workload_type} processes")
     print(f"  Workload: {preset['description']}")
@@ -140,20 +129,26 @@ def generate_and_get_processes(workload_type="standard", num_processes=10, arriv
 def parse_value(value):
     """Try to convert string to appropriate type"""
     # Try boolean
-    if value.lower() in ("true", "false"):
-        return value.lower() == "true"
-    # Try int
+    low = value.lower()
+    if low in ("true", "false"):
+        return low == "true"
+    # Try int / float with cheap character checks instead of try/except
+    digits = value[1:] if value[:1] in ("-", "+") else value
+    if digits.isascii() and digits.isdigit():
+        return int(value)
+    whole, dot, frac = digits.partition(".")
+    if dot and (whole + frac).isascii() and (whole + frac).isdigit():
+        return float(value)
+    # Rarer forms the checks above miss ("1e5", "1_000", "inf") still parse as numbers
     try:
         return int(value)
     except ValueError:
         pass
-    # Try float
     try:
         return float(value)
     except ValueError:
-        pass
-    # Give up, return string
-    return value
+        # Give up, return string
+        return value
 
 def argParse():
     """Parse command line arguments into a dictionary"""
@@ -168,6 +163,10 @@ def argParse():
 # Main execution
 # ---------------------------------------
 if __name__ == "__main__":
+    # rich (and pygame for the visualizer) are only imported when run as a
+    # script, so importing this module for its loaders stays cheap
+    from rich import print
+
     # Parse command line arguments
     args = argParse()
 
@@ -181,6 +180,7 @@ if __name__ == "__main__":
     generate_num = args.get("generate_num", 10)
     arrival_spacing = args.get("arrival_spacing", None)
     save_temp = args.get("save_temp", False)  # Optionally save to file for testing
+    seed = args.get("seed", None)  # Same seed -> same generated workload
 
     # Determine how to get processes
     processes = []
@@ -191,7 +191,8 @@ if __name__ == "__main__":
             workload_type=workload,
             num_processes=generate_num,
             arrival_spacing=arrival_spacing,
-            save_temp=save_temp
+            save_temp=save_temp,
+            seed=seed
         )
 
         if not processes:
@@ -211,7 +212,8 @@ if __name__ == "__main__":
             workload_type="standard",
             num_processes=generate_num,
             arrival_spacing=arrival_spacing,
-            save_temp=save_temp
+            save_temp=save_temp,
+            seed=seed
         )
 
     if not processes:
@@ -258,13 +260,14 @@ if __name__ == "__main__":
 
     # Initialize scheduler and run simulation
     clock = Clock()
-    sched = Scheduler(num_cpus=cpus, num_ios=ios, verbose=True, algorithm=algorithm)
+    # capture structured events, the timeline is exported after the run
+    sched = Scheduler(num_cpus=cpus, num_ios=ios, verbose=True, algorithm=algorithm, capture_events=True)
 
-    for p in processes:
-        sched.add_process(p)
+    sched.add_processes(processes)
 
     # Run with visualizer
     print("\nStarting simulation with visualizer...")
+    from pkg.visualizer import Visualizer
     visualizer = Visualizer(sched)
     visualizer.run()
 
@@ -290,8 +293,14 @@ if __name__ == "__main__":
         else:
             file_id = "generated"
 
-        sched.export_json(f"./timelines/timeline_{algorithm}_{file_id}.json")
-        sched.export_csv(f"./timelines/timeline_{algorithm}_{file_id}.csv")
+        # The two exports are independent, so write them side by side
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            exports = [
+                ex.submit(sched.export_json, f"./timelines/timeline_{algorithm}_{file_id}.json"),
+                ex.submit(sched.export_csv, f"./timelines/timeline_{algorithm}_{file_id}.csv"),
+            ]
+            for export in exports:
+                export.result()  # re-raise any write error here
 
         print(f"\nTimeline exported to:")
         print(f"  ./timelines/timeline_{algorithm}_{file_id}.json")
@@ -3,5 +3,6 @@ from .cpu import CPU
 from .ioDevice import IODevice
 from .scheduler import Scheduler
 from .process import Process
+from .readyQueue import FifoReadyQueue, KeyedReadyQueue
 
-__all__ = ["Clock", "CPU", "IODevice", "Scheduler", "Process"]
+__all__ = ["Clock", "CPU", "IODevice", "Scheduler", "Process", "FifoReadyQueue", "KeyedReadyQueue"]
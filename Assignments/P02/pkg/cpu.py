@@ -35,8 +35,9 @@ class CPU:
         """
         if not self.current:
             return None
-        # Process the current burst
-        burst = self.current.current_burst()
+        # Process the current burst (read straight from the burst list: this runs every tick)
+        bursts = self.current.bursts
+        burst = bursts[0] if bursts else None
         # If it's a CPU burst, decrement its time
         if burst and "cpu" in burst:
             burst["cpu"] -= 1
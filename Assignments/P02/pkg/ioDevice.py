@@ -33,8 +33,9 @@ class IODevice:
         """Advance the process on the IO device by one time unit"""
         if not self.current:
             return None
-        # Process the current burst
-        burst = self.current.current_burst()
+        # Process the current burst (read straight from the burst list: this runs every tick)
+        bursts = self.current.bursts
+        burst = bursts[0] if bursts else None
         # If it's an I/O burst, decrement its duration
         if burst and "io" in burst:
             burst["io"]["duration"] -= 1
@@ -1,10 +1,13 @@
+import collections
+
+
 # ---------------------------------------
 class Process:
     """
     Represents a process with CPU and I/O bursts
     Attributes:
         pid: unique process ID
-        bursts: list of bursts [{"cpu": X}, {"io": {"type": T, "duration": D}}, ...]
+        bursts: deque of bursts [{"cpu": X}, {"io": {"type": T, "duration": D}}, ...], current first
         priority: scheduling priority (0 = highest)
         state: current state ("new", "ready", "running", "waiting", "finished")
     Methods:
@@ -14,6 +17,10 @@ class Process:
         __str__(): user-friendly string representation
     """
 
+    # Fixed attribute layout: no per-instance __dict__, smaller objects and
+    # faster attribute reads in the scheduler's per-tick loops
+    __slots__ = ("pid", "bursts", "priority", "state", "quantum", "remaining_quantum", "arrival_time")
+
     def __init__(self, pid, bursts, priority=0, quantum=4, arrival_time=0):
         """Initialize process with pid, bursts, and priority"""
         self.pid = pid
@@ -26,7 +33,8 @@ class Process:
                 burst = {"io": {"duration": burst["io"]}}
             normalized.append(burst)
 
-        self.bursts = normalized
+        # A deque so advancing drops the finished burst off the front in O(1)
+        self.bursts = collections.deque(normalized)
 
         self.priority = priority
         self.state = "new"
@@ -35,9 +43,11 @@ class Process:
         self.arrival_time = arrival_time
 
     def remaining_burst_time(self):
-        burst = self.current_burst()
-        if burst and "cpu" in burst:
-            return burst["cpu"]
+        # called every tick for running processes, so read the burst list directly
+        # instead of going through current_burst()
+        bursts = self.bursts
+        if bursts:
+            return bursts[0].get("cpu", 0)
         return 0
     
     def current_burst(self):
@@ -49,7 +59,7 @@ class Process:
         """Move to the next burst"""
         if self.bursts:
             # Remove the first burst
-            self.bursts.pop(0)
+            self.bursts.popleft()
             # No return needed - modifies in place and current_burst() will reflect change
             self.remaining_quantum = self.quantum
 
@@ -0,0 +1,132 @@
+import bisect
+import collections
+import heapq
+import itertools
+
+
+# ---------------------------------------
+class FifoReadyQueue:
+    """
+    Ready queue served in arrival order (RR and other FIFO algorithms)
+    Methods:
+        push(process): add a process to the back of the queue
+        pop(): remove and return the process at the front
+        peek(): return the process at the front without removing it
+        remove(process): take a process out of the queue
+        update(process): no-op, FIFO order does not depend on the process
+        __len__(): number of queued processes
+        __iter__(): processes in the order they will be served
+    """
+
+    def __init__(self):
+        """Initialize an empty queue"""
+        self._items = collections.deque()
+
+    def push(self, process):
+        """Add a process to the back of the queue"""
+        self._items.append(process)
+
+    def pop(self):
+        """Remove and return the process at the front"""
+        return self._items.popleft()
+
+    def peek(self):
+        """Return the process at the front, or None if empty"""
+        return self._items[0] if self._items else None
+
+    def remove(self, process):
+        """Take a queued process out of the queue"""
+        self._items.remove(process)
+
+    def update(self, process):
+        """FIFO order does not depend on the process, nothing to re-key"""
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+
+# ---------------------------------------
+class KeyedReadyQueue:
+    """
+    Ready queue ordered by a scheduling key, kept as a binary heap
+    Attributes:
+        key: function returning the sort key of a process (lowest runs first)
+    Methods:
+        push(process): add a process, O(log n); re-pushing a queued process re-keys it
+        pop(): remove and return the process with the lowest key, O(log n)
+        peek(): return the process with the lowest key without removing it
+        peek_key(): the key peek()'s process was queued with (no key call)
+        remove(process): take a process out of the queue, O(1)
+        update(process): re-key a queued process whose key has changed, O(log n)
+        __len__(): number of queued processes
+        __iter__(): processes in the order they will be served
+    Processes with equal keys are served in the order they were pushed.
+    remove/update use lazy deletion: the old heap entry is only marked dead
+    and is dropped when it reaches the top, instead of searching the heap.
+    The first iteration builds a sorted list of the live entries; after that
+    it is kept in order with bisect, so listing the queue is not a sort each time.
+    """
+
+    def __init__(self, key):
+        """Initialize an empty queue ordered by key"""
+        self.key = key
+        self._heap = []     # [key, seq, process]; seq keeps ties FIFO and never compares processes
+        self._entries = {}  # process -> its live heap entry
+        self._ordered = None  # live entries in service order, built on first iteration
+        self._counter = itertools.count()
+
+    def push(self, process):
+        """Add a process, ordered by its key at the time of the push"""
+        if process in self._entries:
+            self.remove(process)
+        entry = [self.key(process), next(self._counter), process]
+        self._entries[process] = entry
+        heapq.heappush(self._heap, entry)
+        if self._ordered is not None:
+            bisect.insort(self._ordered, entry)
+
+    def pop(self):
+        """Remove and return the process with the lowest key"""
+        while self._heap:
+            process = heapq.heappop(self._heap)[2]
+            if process is not None:  # skip entries killed by remove/update
+                del self._entries[process]
+                if self._ordered is not None:
+                    del self._ordered[0]  # the lowest live entry is the one just popped
+                return process
+        raise IndexError("pop from an empty ready queue")
+
+    def peek(self):
+        """Return the process with the lowest key, or None if empty"""
+        heap = self._heap
+        while heap and heap[0][2] is None:
+            heapq.heappop(heap)
+        return heap[0][2] if heap else None
+
+    def peek_key(self):
+        """Return the stored key of the process peek() returns, or None if empty"""
+        return self._heap[0][0] if self.peek() is not None else None
+
+    def remove(self, process):
+        """Take a queued process out of the queue"""
+        entry = self._entries.pop(process)
+        if self._ordered is not None:
+            del self._ordered[bisect.bisect_left(self._ordered, entry)]
+        entry[2] = None
+
+    def update(self, process):
+        """Re-key a queued process after something it is keyed on changed"""
+        if process in self._entries:
+            self.push(process)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        # heap order is not service order, so callers that list the queue get the sorted view
+        if self._ordered is None:
+            self._ordered = sorted(self._entries.values())
+        return iter([entry[2] for entry in self._ordered])
@@ -1,9 +1,47 @@
 from pkg.clock import Clock
 from pkg.cpu import CPU
 from pkg.ioDevice import IODevice
+from pkg.readyQueue import FifoReadyQueue, KeyedReadyQueue
+from operator import attrgetter, methodcaller
 import collections
 import csv
+import heapq
+import itertools
 import json
+import sys
+
+# orjson is optional: serializes the event list in C, falls back to the stdlib json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _next_cpu_burst(process):
+    """SJF key: length of the upcoming CPU burst (inf if there is none)"""
+    burst = process.current_burst()
+    return burst.get("cpu", float('inf')) if burst else float('inf')
+
+
+# One structured event; a namedtuple keeps each record a compact tuple (no
+# per-event dict) and is already a CSV row in column order
+Event = collections.namedtuple("Event", [
+    "time", "event", "event_type", "process", "device",
+    "ready_count", "wait_count", "running_count", "io_count", "finished_count",
+    "cpus", "ios",
+])
+
+
+# Ready queue ordering per algorithm (lowest key runs first); algorithms not
+# listed here (RR and others) use a FIFO queue
+READY_QUEUE_KEYS = {
+    "FCFS": attrgetter("arrival_time"),
+    "SJF": _next_cpu_burst,
+    "SRTF": methodcaller("remaining_burst_time"),
+    "Priority": attrgetter("priority"),
+    "PriorityPreemptive": attrgetter("priority"),
+}
 
 
 class Scheduler:
@@ -12,28 +50,33 @@ class Scheduler:
 
     Attributes:
         clock: shared Clock instance
-        ready_queue: deque of processes ready for CPU
+        ready_queue: ready queue (heap ordered by the algorithm, FIFO for RR)
         wait_queue: deque of processes waiting for I/O
         cpus: list of CPU instances
         io_devices: list of IODevice instances
+        busy_cpus: number of CPUs running a process (updated by step())
+        busy_ios: number of I/O devices serving a process (updated by step())
         finished: list of completed processes
         log: human-readable log of events
-        events: structured log of events for export
+        events: structured log of Event tuples for export (only filled when capture_events is True)
         verbose: if True, print log entries to console
+        capture_events: if True, record structured events so the timeline can be exported
     Methods:
         add_process(process): add a new process to the ready queue
+        add_processes(processes): add many processes at once
         step(): advance the scheduler by one time unit
-        run(): run the scheduler until all processes are finished
+        run(): run the scheduler until all processes are finished (idle gaps are skipped)
         timeline(): return the human-readable log as a string
         export_json(filename): export the structured log to a JSON file
         export_csv(filename): export the structured log to a CSV file"""
 
-    def __init__(self, num_cpus=1, num_ios=1, verbose=True, algorithm="RR"):
+    def __init__(self, num_cpus=1, num_ios=1, verbose=True, algorithm="RR", capture_events=False):
 
         self.clock = Clock()  # shared clock instance for all components Borg pattern
 
-        # deque (double ended queue) for efficient pops from left
-        self.ready_queue = collections.deque()
+        # heap ordered by the algorithm's key, or a plain FIFO for RR and others
+        key = READY_QUEUE_KEYS.get(algorithm)
+        self.ready_queue = KeyedReadyQueue(key) if key else FifoReadyQueue()
 
         # deque (double ended queue) for efficient pops from left
         self.wait_queue = collections.deque()
@@ -43,129 +86,106 @@ class Scheduler:
 
         # uses a list comprehension to create a list of IODevice objects
         self.io_devices = [IODevice(did=i, clock=self.clock) for i in range(num_ios)]
+        self.busy_cpus = 0  # devices with a current process, counted as step() visits them
+        self.busy_ios = 0
 
         self.finished = []  # list of finished processes
         self.log = []  # human-readable + snapshots
         self.events = []  # structured log for export
+        self.capture_events = capture_events  # structured events are opt-in; only exports need them
         self.verbose = verbose  # if True, print log entries to console
-        self.future_processes = []  # processes that have not yet started
+        self._output = []  # verbose log lines not yet written to stdout
+        self._arrived = {}  # pid -> Process for every process that has arrived (see processes())
+        self._snapshot_cache = None  # ((clock, log length), snapshot dict) from the last snapshot()
+        self.future_processes = []  # heap of (arrival_time, seq, process) not yet arrived
+        self._future_seq = itertools.count()  # keeps equal arrival times in insertion order
+        self._future_ordered = True  # False while future_processes has unheapified appends
         self.algorithm = algorithm
 
+        # The algorithm is fixed for the run, so pick its preemption check once
+        # here instead of branching on the algorithm name per CPU per tick
+        self._preempt = {
+            "RR": self._preempt_rr,
+            "SRTF": self._preempt_srtf,
+            "PriorityPreemptive": self._preempt_priority,
+        }.get(algorithm)
+
     def _insert_into_ready_queue(self, process):
         """Insert a process into ready queue according to algorithm"""
-        if self.algorithm == "FCFS":
-            # FCFS: Insert in order of arrival time (earliest first)
-            pos = 0
-            for p in self.ready_queue:
-                if process.arrival_time < p.arrival_time:
-                    break
-                pos += 1
-
-            temp_list = list(self.ready_queue)
-            temp_list.insert(pos, process)
-            self.ready_queue = collections.deque(temp_list)
-
-        elif self.algorithm in ["SJF", "SRTF"]:
-            # SJF/SRTF: Insert in sorted order by burst/remaining time
-            if self.algorithm == "SJF":
-                burst = process.current_burst()
-                key_value = burst.get("cpu", float('inf')) if burst else float('inf')
-            else:  # SRTF
-                key_value = process.remaining_burst_time()
-
-            # Find position to insert (ascending order)
-            pos = 0
-            for p in self.ready_queue:
-                if self.algorithm == "SJF":
-                    p_burst = p.current_burst()
-                    p_value = p_burst.get("cpu", float('inf')) if p_burst else float('inf')
-                else:  # SRTF
-                    p_value = p.remaining_burst_time()
-
-                if key_value < p_value:
-                    break
-                pos += 1
-
-            temp_list = list(self.ready_queue)
-            temp_list.insert(pos, process)
-            self.ready_queue = collections.deque(temp_list)
-
-        elif self.algorithm in ["Priority", "PriorityPreemptive"]:
-            # Priority: Insert in sorted order by priority (lower number = higher priority)
-            pos = 0
-            for p in self.ready_queue:
-                if process.priority < p.priority:
-                    break
-                pos += 1
-
-            temp_list = list(self.ready_queue)
-            temp_list.insert(pos, process)
-            self.ready_queue = collections.deque(temp_list)
-
-        else:
-            # RR and others: append to right (end of queue)
-            self.ready_queue.append(process)
+        # The queue object knows the algorithm's ordering, so this is O(log n) (O(1) for FIFO)
+        self.ready_queue.push(process)
 
     def _select_process_for_cpu(self):
         """Select a process from ready queue based on scheduling algorithm"""
         if not self.ready_queue:
             return None
 
-        if self.algorithm == "FCFS":
-            # FCFS: Process with earliest arrival time is at the front
-            # Since we maintain queue in arrival time order, pop from left
-            return self.ready_queue.popleft()
-
-        elif self.algorithm == "SJF":
-            # SJF: Find process with shortest next CPU burst
-            if not self.ready_queue:
-                return None
-
-            # Find the process with minimum CPU burst time
-            shortest_proc = min(
-                self.ready_queue,
-                key=lambda p: p.current_burst().get("cpu", float('inf')) if p.current_burst() else float('inf')
+        # Front of the queue is the earliest arrival (FCFS), shortest burst (SJF),
+        # shortest remaining time (SRTF), highest priority (Priority*) or next in line (RR)
+        return self.ready_queue.pop()
+
+    # ---- Preemption, one method per preemptive algorithm ----
+    def _preempt_rr(self, cpu):
+        """RR: count down the running process's quantum and preempt it when it runs out"""
+        current = cpu.current
+        current.remaining_quantum -= 1
+        if current.remaining_quantum <= 0 and current.remaining_burst_time() > 0:
+            # Preempt for RR - quantum expired
+            cpu.current = None
+            current.state = "ready"
+            current.remaining_quantum = current.quantum
+            self._insert_into_ready_queue(current)
+            self._record(
+                f"{current.pid} quantum expired (RR preemption)",
+                event_type="preempted",
+                proc=current.pid,
+                device=f"CPU{cpu.cid}",
             )
-            self.ready_queue.remove(shortest_proc)
-            return shortest_proc
 
-        elif self.algorithm == "SRTF":
-            # SRTF: Find process with shortest remaining burst time
-            if not self.ready_queue:
-                return None
-
-            shortest_proc = min(
-                self.ready_queue,
-                key=lambda p: p.remaining_burst_time()
+    def _preempt_srtf(self, cpu):
+        """SRTF: preempt when a ready process has less remaining time than the running one"""
+        if not self.ready_queue:
+            return
+        current_proc = cpu.current
+        # Shortest remaining time in the ready queue is always at its front, and
+        # its remaining time is the key the heap stored when it was queued
+        shortest_ready = self.ready_queue.peek()
+        if self.ready_queue.peek_key() < current_proc.remaining_burst_time():
+            # Preempt current process
+            cpu.current = None
+            current_proc.state = "ready"
+            self._insert_into_ready_queue(current_proc)
+            # Dispatch the shorter process
+            new_proc = self._select_process_for_cpu()
+            cpu.assign(new_proc)
+            self._record(
+                f"{shortest_ready.pid} preempts {current_proc.pid} (SRTF)",
+                event_type="preempted",
+                proc=current_proc.pid,
+                device=f"CPU{cpu.cid}",
             )
-            self.ready_queue.remove(shortest_proc)
-            return shortest_proc
-
-        elif self.algorithm == "Priority":
-            # Priority: Find process with highest priority (lowest number)
-            if not self.ready_queue:
-                return None
-
-            highest_priority = min(self.ready_queue, key=lambda p: p.priority)
-            self.ready_queue.remove(highest_priority)
-            return highest_priority
-
-        elif self.algorithm == "PriorityPreemptive":
-            # Preemptive priority: same as Priority for selection
-            if not self.ready_queue:
-                return None
 
-            highest_priority = min(self.ready_queue, key=lambda p: p.priority)
-            self.ready_queue.remove(highest_priority)
-            return highest_priority
-
-        elif self.algorithm == "RR":
-            # RR: Simple FIFO, take from front of queue
-            return self.ready_queue.popleft()
-
-        else:
-            # Default: FIFO
-            return self.ready_queue.popleft()
+    def _preempt_priority(self, cpu):
+        """PriorityPreemptive: preempt when a ready process has a higher priority (lower number)"""
+        if not self.ready_queue:
+            return
+        current_proc = cpu.current
+        # Highest priority (lowest number) in the ready queue is always at its front
+        highest_ready = self.ready_queue.peek()
+        if highest_ready.priority < current_proc.priority:
+            # Preempt current process
+            cpu.current = None
+            current_proc.state = "ready"
+            self._insert_into_ready_queue(current_proc)
+            # Dispatch the higher priority process
+            new_proc = self._select_process_for_cpu()
+            cpu.assign(new_proc)
+            self._record(
+                f"{highest_ready.pid} preempts {current_proc.pid} (Priority)",
+                event_type="preempted",
+                proc=current_proc.pid,
+                device=f"CPU{cpu.cid}",
+            )
 
     def on_state_change(self, callback):
         """Register a callback for state changes (e.g., for the View)."""
@@ -183,30 +203,58 @@ class Scheduler:
             # Put process in ready queue if the arrival time has passed
             process.state = "ready"
             self._insert_into_ready_queue(process)
+            self._arrived[process.pid] = process
 
             self._record(
                 f"{process.pid} added to ready queue (arrival={process.arrival_time})",
                 event_type="enqueue",
                 proc=process.pid
             )
+            self._flush_output()
         else:
-            # Put process in future_processes list if not arrived yet
-            self.future_processes.append(process)
+            # Put process in future_processes if not arrived yet; the list is
+            # heapified once when the scheduler next needs it (see _order_future)
+            self.future_processes.append((process.arrival_time, next(self._future_seq), process))
+            self._future_ordered = False
 
-            # Sort future processes by arrival time for efficiency
-            self.future_processes.sort(key=lambda p: p.arrival_time)
+    def add_processes(self, processes):
+        """
+        Add many processes at once
+        Args:
+            processes: iterable of Process instances
+        Returns: None
+        """
+        now = self.clock.now()
+        future = []
+        for process in processes:
+            if process.arrival_time <= now:
+                self.add_process(process)
+            else:
+                future.append(process)
+
+        # Appended unordered; heapified once for the whole batch by _order_future
+        self.future_processes.extend((p.arrival_time, next(self._future_seq), p) for p in future)
+        self._future_ordered = False
+
+    def _order_future(self):
+        """
+        Heapify future_processes if processes were added since it was last ordered
+        Adding N processes before a run costs one O(N) heapify instead of N pushes.
+        Returns: the future_processes heap
+        """
+        if not self._future_ordered:
+            heapq.heapify(self.future_processes)
+            self._future_ordered = True
+        return self.future_processes
 
     def processes(self):
-        """Return all processes known to the scheduler"""
-        all = (
-                list(self.ready_queue)
-                + list(self.wait_queue)
-                + self.finished
-                + [cpu.current for cpu in self.cpus if cpu.current]
-                + [dev.current for dev in self.io_devices if dev.current]
-        )
-        rdict = {p.pid: p for p in all}
-        return rdict
+        """
+        Return all processes known to the scheduler (every process that has arrived)
+        Returns: dict of pid -> Process, kept up to date by the scheduler; treat it as read-only
+        """
+        # An arrived process is always in a queue, on a device or finished, so the
+        # registry filled at arrival is the same set the queues would give, in O(1)
+        return self._arrived
 
     def _record(self, event, event_type="info", proc=None, device=None):
         """
@@ -221,25 +269,33 @@ class Scheduler:
         entry = f"time={self.clock.now():<3} | {event}"
         self.log.append(entry)
 
-        # Print to console if verbose
+        # Print to console if verbose (buffered, written once per step by _flush_output)
         if self.verbose:
-            print(entry)
+            self._output.append(entry)
 
-        # structured record for export as JSON/CSV
+        # structured record for export as JSON/CSV (skipped unless an export is planned)
+        if not self.capture_events:
+            return
+        # Queue sizes are O(1) counts rather than full pid lists: listing the
+        # (sorted) ready queue on every event was the dominant cost of capture.
+        # Device occupancy stays per device, it is small and the Gantt chart needs it.
+        cpus = [cpu.current.pid if cpu.current else None for cpu in self.cpus]
+        ios = [dev.current.pid if dev.current else None for dev in self.io_devices]
         self.events.append(
-            {
-                "time": self.clock.now(),
-                "event": event,
-                "event_type": event_type,
-                "process": proc,
-                "device": device,
-                "ready_queue": [p.pid for p in self.ready_queue],
-                "wait_queue": [p.pid for p in self.wait_queue],
-                "cpus": [cpu.current.pid if cpu.current else None for cpu in self.cpus],
-                "ios": [
-                    dev.current.pid if dev.current else None for dev in self.io_devices
-                ],
-            }
+            Event(
+                self.clock.now(),
+                event,
+                event_type,
+                proc,
+                device,
+                len(self.ready_queue),
+                len(self.wait_queue),
+                len(cpus) - cpus.count(None),
+                len(ios) - ios.count(None),
+                len(self.finished),
+                cpus,
+                ios,
+            )
         )
 
     def _snapshot(self):
@@ -262,80 +318,43 @@ class Scheduler:
         Advance the scheduler by one time unit
         Returns: None
         """
-        # Handle arrivals
+        # Hot loop: look the scheduler's attributes and bound methods up once
+        algo = self.algorithm
+        ready = self.ready_queue
+        wait = self.wait_queue
+        insert = self._insert_into_ready_queue
+        record = self._record
+        callback = self._callback
+        preempt = self._preempt
+
+        # Handle arrivals: pop from the heap only the processes whose time has come
         arrivals = []
-        for p in self.future_processes[:]:  # Iterate over copy
-            if p.arrival_time <= self.clock.now():
-                p.state = "ready"
-                self._insert_into_ready_queue(p)
-                arrivals.append(p)
-                self.future_processes.remove(p)
+        future = self._order_future()
+        now = self.clock.now()
+        while future and future[0][0] <= now:
+            p = heapq.heappop(future)[2]
+            p.state = "ready"
+            insert(p)
+            self._arrived[p.pid] = p
+            arrivals.append(p)
 
         for p in arrivals:
-            self._record(
+            record(
                 f"{p.pid} arrived (arrival_time={p.arrival_time})",
                 event_type="arrival",
                 proc=p.pid
             )
 
         # CPU Ticks
+        busy_cpus = 0
         for cpu in self.cpus:
             proc = cpu.tick()
 
-            # Quantum handling only for RR algorithm
-            if self.algorithm == "RR" and cpu.current:
-                cpu.current.remaining_quantum -= 1
-                if cpu.current.remaining_quantum <= 0 and cpu.current.remaining_burst_time() > 0:
-                    # Preempt for RR - quantum expired
-                    prem_process = cpu.current
-                    cpu.current = None
-                    prem_process.state = "ready"
-                    prem_process.remaining_quantum = prem_process.quantum
-                    self._insert_into_ready_queue(prem_process)
-                    self._record(
-                        f"{prem_process.pid} quantum expired (RR preemption)",
-                        event_type="preempted",
-                        proc=prem_process.pid,
-                        device=f"CPU{cpu.cid}",
-                    )
-
-            # Preemption for SRTF / PriorityPreemptive
-            elif cpu.current and self.ready_queue and self.algorithm in ["SRTF", "PriorityPreemptive"]:
-                current_proc = cpu.current
-                if self.algorithm == "SRTF":
-                    # Find process in ready queue with shortest remaining time
-                    shortest_ready = min(self.ready_queue, key=lambda p: p.remaining_burst_time())
-                    if shortest_ready.remaining_burst_time() < current_proc.remaining_burst_time():
-                        # Preempt current process
-                        cpu.current = None
-                        current_proc.state = "ready"
-                        self._insert_into_ready_queue(current_proc)
-                        # Dispatch the shorter process
-                        new_proc = self._select_process_for_cpu()
-                        cpu.assign(new_proc)
-                        self._record(
-                            f"{shortest_ready.pid} preempts {current_proc.pid} (SRTF)",
-                            event_type="preempted",
-                            proc=current_proc.pid,
-                            device=f"CPU{cpu.cid}",
-                        )
-                elif self.algorithm == "PriorityPreemptive":
-                    # Find process in ready queue with higher priority (lower number)
-                    highest_ready = min(self.ready_queue, key=lambda p: p.priority)
-                    if highest_ready.priority < current_proc.priority:
-                        # Preempt current process
-                        cpu.current = None
-                        current_proc.state = "ready"
-                        self._insert_into_ready_queue(current_proc)
-                        # Dispatch the higher priority process
-                        new_proc = self._select_process_for_cpu()
-                        cpu.assign(new_proc)
-                        self._record(
-                            f"{highest_ready.pid} preempts {current_proc.pid} (Priority)",
-                            event_type="preempted",
-                            proc=current_proc.pid,
-                            device=f"CPU{cpu.cid}",
-                        )
+            # Algorithm-specific preemption (RR quantum, SRTF, PriorityPreemptive)
+            if preempt and cpu.current:
+                preempt(cpu)
+            if cpu.current:
+                busy_cpus += 1
 
             # Handle CPU burst completion
             if proc:
@@ -344,9 +363,9 @@ class Scheduler:
                     # Finished all bursts
                     proc.state = "finished"
                     self.finished.append(proc)
-                    if self._callback:
-                        self._callback(proc.pid, "finished")
-                    self._record(
+                    if callback:
+                        callback(proc.pid, "finished")
+                    record(
                         f"{proc.pid} finished all bursts",
                         event_type="finished",
                         proc=proc.pid,
@@ -355,8 +374,8 @@ class Scheduler:
                 elif "io" in next_burst:
                     # Moving to I/O
                     proc.state = "waiting"
-                    self.wait_queue.append(proc)
-                    self._record(
+                    wait.append(proc)
+                    record(
                         f"{proc.pid} finished CPU → wait queue",
                         event_type="cpu_to_io",
                         proc=proc.pid,
@@ -365,10 +384,10 @@ class Scheduler:
                 elif "cpu" in next_burst:
                     # Moving to next CPU burst (e.g., after I/O in multi-burst processes)
                     proc.state = "ready"
-                    self._insert_into_ready_queue(proc)
-                    if self._callback:
-                        self._callback(proc.pid, "ready")
-                    self._record(
+                    insert(proc)
+                    if callback:
+                        callback(proc.pid, "ready")
+                    record(
                         f"{proc.pid} finished CPU → ready queue",
                         event_type="cpu_to_ready",
                         proc=proc.pid,
@@ -376,17 +395,20 @@ class Scheduler:
                     )
 
         # Tick IO devices
+        busy_ios = 0
         for dev in self.io_devices:
             proc = dev.tick()
+            if dev.current:
+                busy_ios += 1
             if proc:
                 next_burst = proc.current_burst()
                 if next_burst is None:
                     # Finished all bursts
                     proc.state = "finished"
                     self.finished.append(proc)
-                    if self._callback:
-                        self._callback(proc.pid, "finished")
-                    self._record(
+                    if callback:
+                        callback(proc.pid, "finished")
+                    record(
                         f"{proc.pid} finished all bursts",
                         event_type="finished",
                         proc=proc.pid,
@@ -395,10 +417,10 @@ class Scheduler:
                 else:
                     # I/O completed, return to ready queue
                     proc.state = "ready"
-                    self._insert_into_ready_queue(proc)
-                    if self._callback:
-                        self._callback(proc.pid, "ready")
-                    self._record(
+                    insert(proc)
+                    if callback:
+                        callback(proc.pid, "ready")
+                    record(
                         f"{proc.pid} finished I/O → ready queue",
                         event_type="io_to_ready",
                         proc=proc.pid,
@@ -407,11 +429,12 @@ class Scheduler:
 
         # Dispatch to CPUs
         for cpu in self.cpus:
-            if not cpu.is_busy() and self.ready_queue:
+            if not cpu.is_busy() and ready:
                 proc = self._select_process_for_cpu()
                 cpu.assign(proc)
-                self._record(
-                    f"{proc.pid} dispatched to CPU{cpu.cid} ({self.algorithm})",
+                busy_cpus += 1
+                record(
+                    f"{proc.pid} dispatched to CPU{cpu.cid} ({algo})",
                     event_type="dispatch_cpu",
                     proc=proc.pid,
                     device=f"CPU{cpu.cid}",
@@ -419,73 +442,138 @@ class Scheduler:
 
         # Dispatch to IO devices
         for dev in self.io_devices:
-            if not dev.is_busy() and self.wait_queue:
-                proc = self.wait_queue.popleft()
+            if not dev.is_busy() and wait:
+                proc = wait.popleft()
                 dev.assign(proc)
-                self._record(
+                busy_ios += 1
+                record(
                     f"{proc.pid} dispatched to IO{dev.did}",
                     event_type="dispatch_io",
                     proc=proc.pid,
                     device=f"IO{dev.did}",
                 )
 
+        self.busy_cpus = busy_cpus
+        self.busy_ios = busy_ios
+
         if self.verbose:
             self._snapshot()
+        self._flush_output()
         self.clock.tick()
 
+    def _flush_output(self):
+        """Write the buffered verbose log lines to stdout in a single write"""
+        if self._output:
+            sys.stdout.write("\n".join(self._output) + "\n")
+            self._output.clear()
+
+    def _skip_io_only_ticks(self):
+        """
+        Fast-forward through ticks in which the only activity is I/O counting down
+        With nothing ready, waiting or on a CPU, such a tick only decrements each busy
+        device's burst, so every tick before the next I/O completion or arrival is
+        applied at once. The step() that follows handles the tick where the event occurs.
+        Returns: None
+        """
+        busy = [dev.current for dev in self.io_devices if dev.current]
+        # A burst of d ticks completes on the d-th tick, so d - 1 of them can be skipped
+        skip = min(p.bursts[0]["io"]["duration"] for p in busy) - 1
+        future = self._order_future()
+        if future:
+            skip = min(skip, future[0][0] - self.clock.now())
+        if skip > 0:
+            for p in busy:
+                p.bursts[0]["io"]["duration"] -= skip
+            self.clock.tick(skip)
+
     def run(self):
         """
         Run the scheduler until all processes are finished
         Returns: None
         """
 
-        # Continue stepping while there are processes in ready/wait queues
-        # or any CPU/IO device is busy
-        while (
-                self.ready_queue
-                or self.wait_queue
-                or any(cpu.is_busy() for cpu in self.cpus)
-                or any(dev.is_busy() for dev in self.io_devices)
-        ):
-            self.step()
+        # Continue stepping while there are processes in ready/wait queues,
+        # any CPU/IO device is busy, or processes are still due to arrive.
+        # The busy checks map attrgetter over the devices so the loop runs in C
+        # instead of a generator calling is_busy()
+        current = attrgetter("current")
+        while True:
+            if self.ready_queue or self.wait_queue or any(map(current, self.cpus)):
+                self.step()
+            elif any(map(current, self.io_devices)):
+                # Only I/O is in progress: skip ahead to the tick something happens
+                self._skip_io_only_ticks()
+                self.step()
+            elif self.future_processes:
+                # Everything is idle until the next arrival: jump the clock
+                # straight there instead of stepping through empty ticks
+                next_arrival = self._order_future()[0][0]
+                if next_arrival > self.clock.now():
+                    self.clock.tick(next_arrival - self.clock.now())
+                self.step()
+            else:
+                break
 
     def timeline(self):
         """Return the human-readable log as a single string"""
         return "\n".join(self.log)
 
     # ---- Exporters ----
+    def _require_events(self):
+        """Fail loudly instead of writing an empty timeline when events were not captured"""
+        if not self.capture_events:
+            raise RuntimeError(
+                "No structured events were recorded; create the Scheduler with "
+                "capture_events=True to export the timeline"
+            )
+
     def export_json(self, filename="timeline.json"):
         """Export the timeline to a JSON file"""
-        with open(filename, "w") as f:
-            json.dump(self.events, f, indent=2)
+        self._require_events()
+        # events are tuples in memory; JSON keeps one object per event
+        records = [e._asdict() for e in self.events]
+        if ORJSON_AVAILABLE:
+            # serialize to bytes in one call and write them in one go
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(records, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, "w") as f:
+                json.dump(records, f, indent=2)
         if self.verbose:
             print(f"✅ Timeline exported to {filename}")
 
     def export_csv(self, filename="timeline.csv"):
         """Export the timeline to a CSV file"""
+        self._require_events()
 
         # If there are no events, do nothing
         if not self.events:
             return
 
-        # Write CSV using DictWriter for structured data
-        # .keys() returns a list of all the keys in a dictionary.
-        keys = self.events[0].keys()
-
+        # Each Event is already a row in column order, so a plain csv.writer
+        # writes them as they are
         # Open the file in write mode with newline='' to prevent extra blank lines on Windows
         with open(filename, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
-            writer.writeheader()
+            writer = csv.writer(f)
+            writer.writerow(Event._fields)
             writer.writerows(self.events)
         if self.verbose:
             print(f"✅ Timeline exported to {filename}")
 
     def snapshot(self):
-        return {
+        """Return the queue/device contents for the View (cached until time moves or an event is logged)"""
+        # every change to what is where is logged, so (clock, log length) tells
+        # whether the last snapshot is still current, e.g. while the View is paused
+        state = (self.clock.now(), len(self.log))
+        if self._snapshot_cache is not None and self._snapshot_cache[0] == state:
+            return self._snapshot_cache[1]
+        snap = {
             "ready": [{"pid": p.pid} for p in self.ready_queue],
             "wait": [{"pid": p.pid} for p in self.wait_queue],
             "cpu": [{"pid": cpu.current.pid if cpu.current else None} for cpu in self.cpus],
             "io": [{"pid": dev.current.pid if dev.current else None} for dev in self.io_devices],
             "finished": [{"pid": p.pid} for p in self.finished],
             "clock": int(self.clock.now())
-        }
\ No newline at end of file
+        }
+        self._snapshot_cache = (state, snap)
+        return snap
\ No newline at end of file
@@ -4,7 +4,8 @@ import sys
 # Visualizer settings
 WIDTH, HEIGHT = 1000, 700  # Increased size for better layout
 BG_COLOR = (245, 245, 245)  # Window background color (light gray)
-FPS = 2
+FPS = 60  # Render rate; the simulation pace is set by SIM_TICK_MS, not by this
+SIM_TICK_MS = 500  # Real milliseconds per scheduler step (2 steps per second)
 QUEUE_WIDTH, QUEUE_HEIGHT = 150, 350  # Slightly larger for more information
 MARGIN = 30
 BOX_HEIGHT = 30
@@ -21,17 +22,70 @@ RUNNING_COLOR = (0, 200, 0)  # Green
 IDLE_COLOR = (150, 150, 150)  # Gray
 ACCENT_COLOR = (220, 20, 60)  # Crimson red for highlights
 
+# numba is optional: compiles the per-box color math below, otherwise it runs as plain Python
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _fcfs_rgb(arrival_time, current_time):
+    """Orange gradient based on arrival time (earlier = darker orange)"""
+    time_diff = max(0, arrival_time - current_time)
+    intensity = max(150, 255 - time_diff * 5)
+    return (min(255, intensity + 100), intensity // 2, 0)
+
+
+def _burst_rgb(burst_time):
+    """Green gradient based on burst length (shorter = darker green); burst_time is a float, inf if none"""
+    intensity = max(100.0, min(255.0, 255.0 - burst_time * 10.0))
+    return (50, int(intensity), 50)
+
+
+def _priority_rgb(priority):
+    """Blue gradient based on priority (higher priority = darker blue)"""
+    intensity = max(100, 255 - priority * 15)
+    return (intensity // 2, intensity // 2, intensity)
+
+
+def _rr_rgb(remaining_quantum, quantum):
+    """Purple gradient based on remaining quantum"""
+    quantum_ratio = remaining_quantum / quantum
+    intensity = int(150 + quantum_ratio * 105)
+    return (intensity, 50, intensity)
+
+
+if NUMBA_AVAILABLE:
+    _fcfs_rgb = njit(cache=True)(_fcfs_rgb)
+    _burst_rgb = njit(cache=True)(_burst_rgb)
+    _priority_rgb = njit(cache=True)(_priority_rgb)
+    _rr_rgb = njit(cache=True)(_rr_rgb)
+
 
 class Visualizer:
+    # Legend text for each algorithm
+    explanations = {
+        "FCFS": "First Come First Served - Executes processes in order of arrival time (AT)",
+        "SJF": "Shortest Job First - Executes process with shortest CPU burst next (B = burst time)",
+        "SRTF": "Shortest Remaining Time First - Preemptive; executes process with shortest remaining burst (R = remaining time)",
+        "Priority": "Priority Scheduling - Lower number = higher priority (Pri = priority)",
+        "PriorityPreemptive": "Preemptive Priority - Can preempt running process if higher priority arrives",
+        "RR": "Round Robin - Each process gets time quantum (Q = remaining/quantum); preempts when quantum expires"
+    }
+
     def __init__(self, scheduler):
         self.scheduler = scheduler
         pygame.init()  # Initialize pygame library
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        # Each frame is drawn off screen and copied to the display in a single blit
+        self._stage = pygame.Surface((WIDTH, HEIGHT)).convert()
         pygame.display.set_caption("CPU Scheduler Visualizer - Algorithm: " + scheduler.algorithm)
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 22)
         self.large_font = pygame.font.Font(None, 28)
         self.title_font = pygame.font.Font(None, 36)
+        self.small_font = pygame.font.Font(None, 16)  # for box labels too wide for self.font
 
         # Color schemes for different algorithms
         self.algorithm_colors = {
@@ -43,272 +97,296 @@ class Visualizer:
             "RR": (186, 85, 211)  # Medium Orchid
         }
 
-    def _get_sorted_processes(self, items, algorithm):
-        """Return processes sorted based on algorithm for display"""
-        if not items:
-            return items
+        # The algorithm is fixed for a run: resolve its color and explanation once,
+        # and pick its sort key, box color and box label functions
+        self._algo = algorithm = scheduler.algorithm
+        self._algo_color = self.algorithm_colors.get(algorithm, BLACK)
+        self._explanation = self.explanations.get(algorithm, algorithm)
+        self._sort_key_fn = {
+            "SJF": self._burst_sort_key,
+            "SRTF": self._remaining_sort_key,
+        }.get(algorithm, lambda process: 0)
+        self._color_fn = {
+            "FCFS": self._fcfs_color,
+            "SJF": self._burst_color,
+            "SRTF": self._burst_color,
+            "Priority": self._priority_color,
+            "PriorityPreemptive": self._priority_color,
+            "RR": self._rr_color,
+        }.get(algorithm, lambda process: RUNNING_COLOR)
+        self._info_fmt = {
+            "FCFS": lambda pid, p: f"P{pid} (AT:{p.arrival_time})",
+            "SJF": lambda pid, p: f"P{pid} (B:{(p.current_burst() or {}).get('cpu', '?')})",
+            "SRTF": lambda pid, p: f"P{pid} (R:{p.remaining_burst_time()})",
+            "Priority": lambda pid, p: f"P{pid} (Pri:{p.priority})",
+            "PriorityPreemptive": lambda pid, p: f"P{pid} (Pri:{p.priority})",
+            "RR": lambda pid, p: f"P{pid} (Q:{p.remaining_quantum}/{p.quantum})",
+        }.get(algorithm, lambda pid, p: f"P{pid}")
+
+        # Queue layout: title, snapshot key and color of each queue, left to right
+        self._queue_defs = [
+            ("Ready Queue", "ready", READY_COLOR),
+            ("Wait Queue", "wait", WAIT_COLOR),
+            ("CPU", "cpu", CPU_COLOR),
+            ("I/O", "io", IO_COLOR),
+            ("Finished", "finished", IDLE_COLOR),
+        ]
+        queue_spacing = (WIDTH - 2 * MARGIN - 5 * QUEUE_WIDTH) // 4
+        self._queue_x = [MARGIN + i * (QUEUE_WIDTH + queue_spacing) for i in range(len(self._queue_defs))]
 
-        processes = []
-        for item in items:
-            pid = item.get("pid")
-            if pid is not None:
-                # Get the actual process object from scheduler
-                all_procs = self.scheduler.processes()
-                if pid in all_procs:
-                    proc = all_procs[pid]
-                    processes.append({
-                        "pid": pid,
-                        "process": proc,
-                        "sort_key": self._get_sort_key(proc, algorithm)
-                    })
-
-        # Sort based on algorithm
-        if algorithm == "FCFS":
-            # First Come First Served - sort by arrival time
-            processes.sort(key=lambda x: x["process"].arrival_time)
-        elif algorithm == "SJF":
-            # Shortest Job First - sort by CPU burst length
-            processes.sort(key=lambda x: (
-                x["sort_key"],  # Burst time
-                x["process"].arrival_time  # Tie breaker
-            ))
-        elif algorithm == "SRTF":
-            # Shortest Remaining Time First - sort by remaining burst time
-            processes.sort(key=lambda x: (
-                x["sort_key"],  # Remaining burst time
-                x["process"].arrival_time
-            ))
-        elif algorithm in ["Priority", "PriorityPreemptive"]:
+        # Box slots and the next-process arrow, relative to a queue's top-left corner
+        max_visible = (QUEUE_HEIGHT - 70) // (BOX_HEIGHT + BOX_PADDING)
+        self._box_rects = [
+            pygame.Rect(20, 70 + i * (BOX_HEIGHT + BOX_PADDING), QUEUE_WIDTH - 40, BOX_HEIGHT)
+            for i in range(max_visible)
+        ]
+        self._arrow_points = [
+            (5, 70 + BOX_HEIGHT // 2),
+            (15, 70 + BOX_HEIGHT // 2 - 7),
+            (15, 70 + BOX_HEIGHT // 2 + 7)
+        ]
+
+        # Semi-transparent queue backgrounds, one pre-converted surface per queue color
+        # (draw.rect ignores the alpha of a color, so the tint is blitted instead)
+        self._queue_bg = {}
+        for _, _, color in self._queue_defs:
+            bg = pygame.Surface((QUEUE_WIDTH, QUEUE_HEIGHT), pygame.SRCALPHA)
+            bg.fill((*color, 30))
+            self._queue_bg[color] = bg.convert_alpha()
+
+        # Rendered text surfaces, keyed by (font, text, color); most labels repeat every frame
+        self._text_cache = {}
+
+        # pid -> Process for the frame being drawn, refreshed after each scheduler step
+        self._procs_cache = None
+
+        # What each part of the frame last showed (queue title, "clock", "stats");
+        # a part is only redrawn when that changes, and an empty dict means repaint everything
+        self._drawn = {}
+
+        # The title is fixed for a run; the time label is re-rendered only when the clock moves
+        self._title_surf = self.title_font.render(
+            f"CPU Scheduler Simulation - {algorithm}", True, self._algo_color)
+        self._time_surf = None
+        self._last_clock = None
+
+        # Legend text never changes for an algorithm: wrap and render it once
+        self._legend_title_surf = self.large_font.render(f"Algorithm: {algorithm}", True, self._algo_color)
+        self._legend_lines = self._wrap_legend(self._explanation)  # wrapped explanation line surfaces
+        self._controls_surf = self.font.render("Controls: SPACE = Step Forward | R = Reset | ESC = Quit", True, BLACK)
+
+    def _render(self, font, text, color):
+        """Return the rendered surface for text, rasterizing it only the first time"""
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            self._text_cache[key] = surf
+        return surf
+
+    def _render_fitted(self, text, max_width):
+        """Render text no wider than max_width: the normal font if it fits, else the small font, truncated if needed"""
+        key = ("fitted", text, max_width)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            font = self.font
+            if font.size(text)[0] > max_width:
+                font = self.small_font
+                while len(text) > 1 and font.size(text)[0] > max_width:
+                    text = text[:-1]
+            surf = font.render(text, True, BLACK)
+            self._text_cache[key] = surf
+        return surf
+
+    def _get_sorted_processes(self, items, algorithm):
+        """Return (pid, Process) pairs for the ready queue items, sorted based on algorithm for display"""
+        # FCFS and RR ready queues already come out of the scheduler in service order
+        # (FCFS by arrival time, RR in round-robin order), so there is nothing to sort
+        all_procs = self._procs_cache
+        pairs = [(item["pid"], all_procs[item["pid"]]) for item in items if item.get("pid") in all_procs]
+        if algorithm in ("FCFS", "RR"):
+            return pairs
+
+        # Sort based on algorithm, using the process each pair already holds
+        if algorithm in ("SJF", "SRTF"):
+            # Shortest (remaining) burst first, arrival time as the tie breaker
+            sort_key = self._sort_key_fn
+            pairs.sort(key=lambda pair: (sort_key(pair[1]), pair[1].arrival_time))
+        elif algorithm in ("Priority", "PriorityPreemptive"):
             # Priority Scheduling - sort by priority (lower = higher priority)
-            processes.sort(key=lambda x: (
-                x["process"].priority,
-                x["process"].arrival_time
-            ))
-        # RR doesn't need sorting - processes execute in round-robin order
-
-        return [{"pid": p["pid"]} for p in processes]
-
-    def _get_sort_key(self, process, algorithm):
-        """Get the sorting key for a process based on algorithm"""
-        if algorithm == "SJF":
-            burst = process.current_burst()
-            return burst.get("cpu", float('inf')) if burst else float('inf')
-        elif algorithm == "SRTF":
-            return process.remaining_burst_time()
-        return 0
-
-    def _get_process_color(self, process, algorithm):
-        """Get color for a process based on algorithm and process properties"""
-        if algorithm == "FCFS":
-            # Orange gradient based on arrival time (earlier = darker orange)
-            arrival_time = process.arrival_time
-            current_time = self.scheduler.clock.now()
-            time_diff = max(0, arrival_time - current_time)
-            intensity = max(150, 255 - time_diff * 5)
-            return (min(255, intensity + 100), intensity // 2, 0)
-
-        elif algorithm in ["SJF", "SRTF"]:
-            # Green gradient based on burst length (shorter = darker green)
-            burst_time = self._get_sort_key(process, algorithm)
-            intensity = max(100, min(255, 255 - burst_time * 10))
-            return (50, intensity, 50)
-
-        elif algorithm in ["Priority", "PriorityPreemptive"]:
-            # Blue gradient based on priority (higher priority = darker blue)
-            priority = process.priority
-            intensity = max(100, 255 - priority * 15)
-            return (intensity // 2, intensity // 2, intensity)
-
-        elif algorithm == "RR":
-            # Purple gradient based on remaining quantum
-            quantum_ratio = process.remaining_quantum / process.quantum
-            intensity = int(150 + quantum_ratio * 105)
-            return (intensity, 50, intensity)
+            pairs.sort(key=lambda pair: (pair[1].priority, pair[1].arrival_time))
 
-        else:
-            return RUNNING_COLOR
+        return pairs
+
+    def _burst_sort_key(self, process):
+        """SJF sort key: length of the current CPU burst"""
+        burst = process.current_burst()
+        return burst.get("cpu", float('inf')) if burst else float('inf')
+
+    def _remaining_sort_key(self, process):
+        """SRTF sort key: CPU time left in the current burst"""
+        return process.remaining_burst_time()
+
+    def _fcfs_color(self, process):
+        """Box color for FCFS, from the process's arrival time"""
+        return _fcfs_rgb(process.arrival_time, self.scheduler.clock.now())
+
+    def _burst_color(self, process):
+        """Box color for SJF/SRTF, from the burst length the queue is sorted on"""
+        return _burst_rgb(float(self._sort_key_fn(process)))
+
+    def _priority_color(self, process):
+        """Box color for the priority algorithms"""
+        return _priority_rgb(process.priority)
+
+    def _rr_color(self, process):
+        """Box color for RR, from the quantum left"""
+        return _rr_rgb(process.remaining_quantum, process.quantum)
 
     def draw_queue(self, x, y, title, items, color, algorithm):
-        """Draw a single queue with its items"""
+        """Draw a single queue with its items; returns the area redrawn, or None if unchanged"""
 
-        # Sort items based on algorithm (only for ready queue)
+        # Sort items based on algorithm (only for ready queue); each item becomes a
+        # (pid, Process) pair, with pid None for an idle device and Process None if unknown
         if title == "Ready Queue":
-            sorted_items = self._get_sorted_processes(items, algorithm)
+            pairs = self._get_sorted_processes(items, algorithm)
         else:
-            sorted_items = items
+            all_procs = self._procs_cache
+            pairs = [(item.get("pid"), all_procs.get(item.get("pid"))) for item in items]
 
-        # Draw queue background
-        pygame.draw.rect(self.screen, (*color, 30), (x, y, QUEUE_WIDTH, QUEUE_HEIGHT))  # Semi-transparent fill
-        pygame.draw.rect(self.screen, color, (x, y, QUEUE_WIDTH, QUEUE_HEIGHT), 2)  # Outline
+        # Work out what each visible box shows before drawing anything
+        max_visible = len(self._box_rects)
+        boxes = []
+
+        for pid, proc in pairs[:max_visible]:
+            # Get box color and process information
+            if pid is not None:
+                if proc is not None:
+                    box_color = self._color_fn(proc)
+                    info = self._info_fmt(pid, proc)  # process info formatted for the algorithm
+                else:
+                    box_color = RUNNING_COLOR
+                    info = f"P{pid}"
+            else:
+                box_color = IDLE_COLOR
+                info = None
+
+            boxes.append((pid, box_color, info))
+
+        # Nothing to redraw if the queue looks the same as last frame
+        state = (boxes, len(pairs))
+        if self._drawn.get(title) == state:
+            return None
+        self._drawn[title] = state
 
         # Draw queue title with algorithm color if ready queue
-        title_text = title
         if title == "Ready Queue":
-            algo_color = self.algorithm_colors.get(algorithm, BLACK)
-            title_surf = self.large_font.render(f"Ready Queue", True, algo_color)
+            title_surf = self._render(self.large_font, f"Ready Queue", self._algo_color)
         else:
-            title_surf = self.large_font.render(title, True, BLACK)
-
+            title_surf = self._render(self.large_font, title, BLACK)
         title_rect = title_surf.get_rect(topleft=(x + 10, y + 8))
-        self.screen.blit(title_surf, title_rect)
 
-        # Draw algorithm indicator for ready queue
+        # Clear everything this queue draws on (labels may stick out past the outline)
+        area = pygame.Rect(x, y, QUEUE_WIDTH, QUEUE_HEIGHT).union(title_rect)
         if title == "Ready Queue":
             algo_text = f"[{algorithm}]"
-            algo_surf = self.font.render(algo_text, True, BLACK)
+            algo_surf = self._render(self.font, algo_text, BLACK)
             algo_rect = algo_surf.get_rect(topleft=(x + 10, y + 38))
-            self.screen.blit(algo_surf, algo_rect)
+            area.union_ip(algo_rect)
+        self._stage.fill(BG_COLOR, area)
 
-        # Draw each process as a box inside the queue
-        max_visible = (QUEUE_HEIGHT - 70) // (BOX_HEIGHT + BOX_PADDING)
-        visible_items = sorted_items[:max_visible]
+        # Draw queue background
+        self._stage.blit(self._queue_bg[color], (x, y))  # Semi-transparent fill
+        pygame.draw.rect(self._stage, color, (x, y, QUEUE_WIDTH, QUEUE_HEIGHT), 2)  # Outline
+
+        self._stage.blit(title_surf, title_rect)
 
-        for i, item in enumerate(visible_items):
-            box_y = y + 70 + i * (BOX_HEIGHT + BOX_PADDING)
+        # Draw algorithm indicator for ready queue
+        if title == "Ready Queue":
+            self._stage.blit(algo_surf, algo_rect)
 
+        # Draw each process as a box inside the queue
+        for i, (pid, box_color, info) in enumerate(boxes):
             # Draw order indicator for first process
-            if i == 0 and title == "Ready Queue" and item.get("pid") is not None:
+            if i == 0 and title == "Ready Queue" and pid is not None:
                 # Draw arrow pointing to next process
-                pygame.draw.polygon(self.screen, ACCENT_COLOR, [
-                    (x + 5, box_y + BOX_HEIGHT // 2),
-                    (x + 15, box_y + BOX_HEIGHT // 2 - 7),
-                    (x + 15, box_y + BOX_HEIGHT // 2 + 7)
-                ])
-
-            box_rect = pygame.Rect(x + 20, box_y, QUEUE_WIDTH - 40, BOX_HEIGHT)
-            pid = item.get("pid")
+                pygame.draw.polygon(self._stage, ACCENT_COLOR, [(x + px, y + py) for px, py in self._arrow_points])
 
-            # Get box color
-            if pid is not None:
-                all_procs = self.scheduler.processes()
-                if pid in all_procs:
-                    proc = all_procs[pid]
-                    box_color = self._get_process_color(proc, algorithm)
-                else:
-                    box_color = RUNNING_COLOR
-            else:
-                box_color = IDLE_COLOR
+            box_rect = self._box_rects[i].move(x, y)
 
             # Draw process box
-            pygame.draw.rect(self.screen, box_color, box_rect, border_radius=5)
-            pygame.draw.rect(self.screen, BLACK, box_rect, 1, border_radius=5)
+            pygame.draw.rect(self._stage, box_color, box_rect, border_radius=5)
+            pygame.draw.rect(self._stage, BLACK, box_rect, 1, border_radius=5)
 
             # Draw process information
-            if pid is not None:
-                all_procs = self.scheduler.processes()
-                if pid in all_procs:
-                    proc = all_procs[pid]
-
-                    # Format process info based on algorithm
-                    if algorithm == "FCFS":
-                        info = f"P{pid} (AT:{proc.arrival_time})"
-                    elif algorithm == "SJF":
-                        burst = proc.current_burst()
-                        burst_time = burst.get("cpu", "?") if burst else "?"
-                        info = f"P{pid} (B:{burst_time})"
-                    elif algorithm == "SRTF":
-                        remaining = proc.remaining_burst_time()
-                        info = f"P{pid} (R:{remaining})"
-                    elif algorithm in ["Priority", "PriorityPreemptive"]:
-                        info = f"P{pid} (Pri:{proc.priority})"
-                    elif algorithm == "RR":
-                        info = f"P{pid} (Q:{proc.remaining_quantum}/{proc.quantum})"
-                    else:
-                        info = f"P{pid}"
-                else:
-                    info = f"P{pid}"
-
-                # Render text
-                pid_surf = self.font.render(info, True, BLACK)
+            if info is not None:
+                # Render text, sized to fit in the box
+                pid_surf = self._render_fitted(info, box_rect.width - 10)
                 text_rect = pid_surf.get_rect(center=box_rect.center)
-
-                # Ensure text fits in box
-                if text_rect.width > box_rect.width - 10:
-                    pid_surf = pygame.transform.scale(pid_surf, (box_rect.width - 10, BOX_HEIGHT - 4))
-
-                self.screen.blit(pid_surf, text_rect)
+                self._stage.blit(pid_surf, text_rect)
 
         # Show overflow indicator if there are more processes than can be displayed
-        if len(sorted_items) > max_visible:
-            overflow_text = f"+{len(sorted_items) - max_visible} more"
-            overflow_surf = self.font.render(overflow_text, True, BLACK)
+        if len(pairs) > max_visible:
+            overflow_text = f"+{len(pairs) - max_visible} more"
+            overflow_surf = self._render(self.font, overflow_text, BLACK)
             overflow_rect = overflow_surf.get_rect(topleft=(x + 20, y + QUEUE_HEIGHT - 25))
-            self.screen.blit(overflow_surf, overflow_rect)
+            self._stage.blit(overflow_surf, overflow_rect)
 
-    def draw_legend(self):
-        """Draw algorithm explanation legend"""
-        algorithm = self.scheduler.algorithm
-        explanations = {
-            "FCFS": "First Come First Served - Executes processes in order of arrival time (AT)",
-            "SJF": "Shortest Job First - Executes process with shortest CPU burst next (B = burst time)",
-            "SRTF": "Shortest Remaining Time First - Preemptive; executes process with shortest remaining burst (R = remaining time)",
-            "Priority": "Priority Scheduling - Lower number = higher priority (Pri = priority)",
-            "PriorityPreemptive": "Preemptive Priority - Can preempt running process if higher priority arrives",
-            "RR": "Round Robin - Each process gets time quantum (Q = remaining/quantum); preempts when quantum expires"
-        }
+        return area
 
-        # Draw legend box
-        legend_rect = pygame.Rect(50, HEIGHT - 120, WIDTH - 100, 100)
-        pygame.draw.rect(self.screen, WHITE, legend_rect)
-        pygame.draw.rect(self.screen, BLACK, legend_rect, 2)
-
-        # Draw algorithm name
-        algo_name = self.large_font.render(f"Algorithm: {algorithm}", True, self.algorithm_colors.get(algorithm, BLACK))
-        self.screen.blit(algo_name, (legend_rect.x + 10, legend_rect.y + 10))
-
-        # Draw explanation
-        explanation = explanations.get(algorithm, algorithm)
-        words = explanation.split()
+    def _wrap_legend(self, explanation):
+        """Word wrap the algorithm explanation into rendered lines (done once, in __init__)"""
+        max_width = WIDTH - 100 - 20  # legend box width minus its padding
         lines = []
         current_line = []
         current_width = 0
 
-        # Word wrap the explanation
-        for word in words:
-            word_surf = self.font.render(word + " ", True, BLACK)
-            if current_width + word_surf.get_width() < legend_rect.width - 20:
+        # Word wrap the explanation, measuring words instead of rendering them
+        for word in explanation.split():
+            word_width = self.font.size(word + " ")[0]
+            if current_width + word_width < max_width:
                 current_line.append(word)
-                current_width += word_surf.get_width()
+                current_width += word_width
             else:
                 lines.append(" ".join(current_line))
                 current_line = [word]
-                current_width = word_surf.get_width()
+                current_width = word_width
 
         if current_line:
             lines.append(" ".join(current_line))
 
-        # Draw wrapped lines
-        for i, line in enumerate(lines):
-            line_surf = self.font.render(line, True, BLACK)
-            self.screen.blit(line_surf, (legend_rect.x + 10, legend_rect.y + 40 + i * 25))
+        return [self.font.render(line, True, BLACK) for line in lines]
+
+    def draw_legend(self):
+        """Draw algorithm explanation legend"""
+        # Draw legend box
+        legend_rect = pygame.Rect(50, HEIGHT - 120, WIDTH - 100, 100)
+        pygame.draw.rect(self._stage, WHITE, legend_rect)
+        pygame.draw.rect(self._stage, BLACK, legend_rect, 2)
+
+        # Draw algorithm name
+        self._stage.blit(self._legend_title_surf, (legend_rect.x + 10, legend_rect.y + 10))
+
+        # Draw explanation
+        for i, line_surf in enumerate(self._legend_lines):
+            self._stage.blit(line_surf, (legend_rect.x + 10, legend_rect.y + 40 + i * 25))
 
         # Draw controls
-        controls = "Controls: SPACE = Step Forward | R = Reset | ESC = Quit"
-        controls_surf = self.font.render(controls, True, BLACK)
-        self.screen.blit(controls_surf, (legend_rect.x + 10, legend_rect.y + legend_rect.height - 25))
+        self._stage.blit(self._controls_surf, (legend_rect.x + 10, legend_rect.y + legend_rect.height - 25))
 
     def draw_statistics(self):
-        """Draw runtime statistics"""
+        """Draw runtime statistics; returns the area redrawn, or None if unchanged"""
         stats_y = HEIGHT - 250
         stats_rect = pygame.Rect(WIDTH - 250, stats_y, 230, 140)
 
-        pygame.draw.rect(self.screen, WHITE, stats_rect)
-        pygame.draw.rect(self.screen, BLACK, stats_rect, 2)
-
-        # Statistics header
-        stats_header = self.large_font.render("Statistics", True, BLACK)
-        self.screen.blit(stats_header, (stats_rect.x + 10, stats_rect.y + 10))
-
         # Gather statistics
-        all_procs = self.scheduler.processes()
         ready_count = len(self.scheduler.ready_queue)
         wait_count = len(self.scheduler.wait_queue)
-        cpu_count = sum(1 for cpu in self.scheduler.cpus if cpu.current)
-        io_count = sum(1 for io in self.scheduler.io_devices if io.current)
+        cpu_count = self.scheduler.busy_cpus
+        io_count = self.scheduler.busy_ios
         finished_count = len(self.scheduler.finished)
         total_count = ready_count + wait_count + cpu_count + io_count + finished_count
 
-        # Draw statistics
         stats = [
             f"Total Processes: {total_count}",
             f"Ready: {ready_count}",
@@ -317,24 +395,47 @@ class Visualizer:
             f"I/O: {io_count}",
             f"Finished: {finished_count}"
         ]
+        if self._drawn.get("stats") == stats:
+            return None
+        self._drawn["stats"] = stats
 
+        # The last line runs past the box onto the legend, so repaint the legend under it first
+        self.draw_legend()
+        area = stats_rect.copy()
+
+        pygame.draw.rect(self._stage, WHITE, stats_rect)
+        pygame.draw.rect(self._stage, BLACK, stats_rect, 2)
+
+        # Statistics header
+        stats_header = self._render(self.large_font, "Statistics", BLACK)
+        self._stage.blit(stats_header, (stats_rect.x + 10, stats_rect.y + 10))
+
+        # Draw statistics
         for i, stat in enumerate(stats):
-            stat_surf = self.font.render(stat, True, BLACK)
-            self.screen.blit(stat_surf, (stats_rect.x + 15, stats_rect.y + 40 + i * 20))
+            stat_surf = self._render(self.font, stat, BLACK)
+            area.union_ip(self._stage.blit(stat_surf, (stats_rect.x + 15, stats_rect.y + 40 + i * 20)))
+
+        return area
 
     def run(self):
         """Main visualization loop"""
         running = True
         auto_step = True  # Set to False for manual stepping with SPACE
+        sim_accum_ms = SIM_TICK_MS  # real time owed to the simulation; start with one step due
+        self.clock.tick()  # don't count the time before the loop toward the first frame
 
         while running:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type == pygame.VIDEOEXPOSE:
+                    # Window contents were lost, repaint all of it next frame
+                    self._drawn.clear()
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE:
                         # Manual step
                         self.scheduler.step()
+                        self._procs_cache = None
                     elif event.key == pygame.K_r:
                         # Reset - you could implement this if needed
                         pass
@@ -344,61 +445,62 @@ class Visualizer:
                         # Toggle auto/manual mode
                         auto_step = not auto_step
 
-            # Auto-step if enabled
+            # Auto-step if enabled: one scheduler step per SIM_TICK_MS of real time,
+            # however long the frames take to draw
             if auto_step:
-                self.scheduler.step()
-
-            # Clear screen
-            self.screen.fill(BG_COLOR)
+                while sim_accum_ms >= SIM_TICK_MS:
+                    self.scheduler.step()
+                    self._procs_cache = None
+                    sim_accum_ms -= SIM_TICK_MS
 
             # Get current state
             snap = self.scheduler.snapshot()
-            algorithm = self.scheduler.algorithm
+            self._procs_cache = self.scheduler.processes()  # looked up once per frame, not per box
+            algorithm = self._algo
+            dirty = []  # areas of the frame that changed and must reach the display
+
+            # Static parts (background, title) are only drawn on a full repaint
+            if not self._drawn:
+                self._stage.fill(BG_COLOR)
+
+                # Draw main title
+                self._stage.blit(self._title_surf, (WIDTH // 2 - self._title_surf.get_width() // 2, 15))
 
-            # Draw main title
-            title = f"CPU Scheduler Simulation - {algorithm}"
-            title_surf = self.title_font.render(title, True, self.algorithm_colors.get(algorithm, BLACK))
-            self.screen.blit(title_surf, (WIDTH // 2 - title_surf.get_width() // 2, 15))
+                dirty.append(self._stage.get_rect())
 
             # Draw current time
-            time_text = f"Time: {snap['clock']}"
-            time_surf = self.large_font.render(time_text, True, BLACK)
-            self.screen.blit(time_surf, (WIDTH - 150, 20))
-
-            # Calculate queue positions
-            queue_spacing = (WIDTH - 2 * MARGIN - 5 * QUEUE_WIDTH) // 4
-
-            # Draw queues
-            self.draw_queue(
-                MARGIN, 80,
-                "Ready Queue", snap["ready"], READY_COLOR, algorithm
-            )
-            self.draw_queue(
-                MARGIN + QUEUE_WIDTH + queue_spacing, 80,
-                "Wait Queue", snap["wait"], WAIT_COLOR, algorithm
-            )
-            self.draw_queue(
-                MARGIN + 2 * (QUEUE_WIDTH + queue_spacing), 80,
-                "CPU", snap["cpu"], CPU_COLOR, algorithm
-            )
-            self.draw_queue(
-                MARGIN + 3 * (QUEUE_WIDTH + queue_spacing), 80,
-                "I/O", snap["io"], IO_COLOR, algorithm
-            )
-            self.draw_queue(
-                MARGIN + 4 * (QUEUE_WIDTH + queue_spacing), 80,
-                "Finished", snap["finished"], IDLE_COLOR, algorithm
-            )
-
-            # Draw legend and statistics
-            self.draw_legend()
-            self.draw_statistics()
-
-            # Update display
-            pygame.display.flip()
-
-            # Control frame rate
-            self.clock.tick(FPS)
+            if self._drawn.get("clock") != snap["clock"]:
+                self._drawn["clock"] = snap["clock"]
+                if snap["clock"] != self._last_clock:
+                    # Only the latest time is kept; the text cache would hold one per tick
+                    self._time_surf = self.large_font.render(f"Time: {snap['clock']}", True, BLACK)
+                    self._last_clock = snap["clock"]
+                time_rect = pygame.Rect(WIDTH - 150, 20, 150, self._time_surf.get_height())
+                self._stage.fill(BG_COLOR, time_rect)
+                self._stage.blit(self._time_surf, time_rect)
+                dirty.append(time_rect)
+
+            # Draw queues (each returns None when it did not change)
+            for queue_x, (title, key, color) in zip(self._queue_x, self._queue_defs):
+                dirty.append(self.draw_queue(queue_x, 80, title, snap[key], color, algorithm))
+
+            # Draw statistics (and the legend under them; both are drawn on a full repaint)
+            dirty.append(self.draw_statistics())
+
+            # Update display: copy only the changed areas and push just those
+            dirty = [rect for rect in dirty if rect is not None]
+            for rect in dirty:
+                self.screen.blit(self._stage, rect, rect)
+            pygame.display.update(dirty)
+
+            # Control frame rate, and bank the frame's real time for the simulation
+            elapsed_ms = self.clock.tick(FPS)
+            if auto_step:
+                # Capped so a stall (window drag, suspend, a slow frame) costs at most one
+                # extra step instead of a burst that makes the animation jump
+                sim_accum_ms = min(sim_accum_ms + elapsed_ms, 2 * SIM_TICK_MS)
+            else:
+                sim_accum_ms = 0  # resume from the keyboard without a burst of catch-up steps
 
         pygame.quit()
         sys.exit()
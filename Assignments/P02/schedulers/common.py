@@ -0,0 +1,78 @@
+"""
+Stages shared by the PB and RR schedulers
+-----------------------------------------
+FCFS, PB and RR all build their table rows with make_row and the COL_* columns.
+Once an algorithm has decided what runs on the CPUs, moving jobs from the Waiting Queue
+to the I/O devices and from the I/O devices back to the Ready Queue works the same way
+for every algorithm. The helpers here take the queues explicitly, plus two callbacks:
+
+- ready(job): put a job back into the algorithm's ready queue
+- show(job, col): record the job's new table row with its burst in column col
+
+The waiting and I/O queues are deques, so each pass rotates through them once.
+"""
+
+# Table column a job's burst is shown in (column 0 is the arrival time, column 7 the exit time)
+COL_READY, COL_RUNNING, COL_WAITING, COL_IO, COL_EXIT = 2, 3, 4, 5, 6
+BLANK_ROW = (" ",) * 8  # copied for each row, then the arrival time and burst are filled in
+
+
+def make_row(job, col, label):
+    """Build a job's 8-column table row with label shown in column col"""
+    row = list(BLANK_ROW)
+    row[0] = str(job.get_arrival_time())
+    row[col] = label
+    if col == COL_EXIT:
+        row[7] = str(job.get_exit_time())
+    return row
+
+
+def advance_waiting(waiting, io_queue, ios, ready, show):
+    """Stage 3: move waiting jobs → an I/O device if one is free, or back to ready after their I/O"""
+    # Rotate through the queue once: jobs that must keep waiting go back on the end
+    for _ in range(len(waiting)):
+        job = waiting.popleft()
+
+        # --- Handle I/O bursts ---
+        if job.get_burst_type() == "IO":
+            # If an I/O device is free, start I/O
+            if len(io_queue) < ios:
+                io_queue.append(job)
+                show(job, COL_IO)
+
+            # Otherwise, wait for I/O availability
+            else:
+                job.increment_io_wait_time()
+                waiting.append(job)
+
+        # --- Handle CPU-ready jobs ---
+        else:
+            ready(job)
+            show(job, COL_READY)
+
+
+def advance_io(io_queue, ready, show):
+    """Stage 4: run one tick of every job's I/O burst, sending finished ones back to ready"""
+    # Rotate through the queue once: jobs still performing I/O go back on the end
+    for _ in range(len(io_queue)):
+        job = io_queue.popleft()
+
+        # --- If I/O burst is finished ---
+        if job.get_burst_time() == 0:
+            job.get_next_burst()
+            ready(job)
+            show(job, COL_READY)
+            continue
+
+        # --- If I/O burst still in progress ---
+        job.decrement_burst_time()
+        show(job, COL_IO)
+
+        # Once I/O completes after decrement
+        if job.get_burst_time() == 0:
+            job.get_next_burst()
+            ready(job)
+            show(job, COL_READY)
+            continue
+
+        io_queue.append(job)
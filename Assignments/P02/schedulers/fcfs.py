@@ -4,63 +4,80 @@ It is non-preemptive, meaning once a job starts executing on the CPU, it runs un
 or performs an I/O operation. Jobs are executed sequentially based on their arrival order.
 """
 
+from collections import deque
+
+from schedulers.common import COL_READY, COL_RUNNING, COL_WAITING, COL_IO, COL_EXIT, make_row
+
 # FCFS Scheduling
 if sched == "FCFS" or sched == "ALL":
 
+    # The FIFO queues are deques so jobs leave from the front in O(1);
+    # convert them the first time through if they were created as lists
+    if not isinstance(FCFS_ReadyQueue, deque):
+        FCFS_ReadyQueue = deque(FCFS_ReadyQueue)
+        FCFS_WaitingQueue = deque(FCFS_WaitingQueue)
+        FCFS_IO_Queue = deque(FCFS_IO_Queue)
+
+    # Last row written to table1 for each job, so unchanged rows are not redrawn. The memo
+    # mirrors what table1 shows, so it starts over on a new run: at clock 0, or when the
+    # caller hands in a different table
+    try:
+        FCFS_RowState
+    except NameError:
+        FCFS_RowState = {}
+        FCFS_RowTable = table1
+    if clock == 0 or FCFS_RowTable is not table1:
+        FCFS_RowState = {}
+        FCFS_RowTable = table1
+
+    def show_row(job, col, pause=True):
+        """Write a job's row to table1 if it changed; only state changes pause for a beat"""
+        jid = job.get_id()
+        row = make_row(job, col, f"J{jid} {job.get_burst_type()} {job.get_burst_time()}")
+        if FCFS_RowState.get(jid) == row:
+            return
+        FCFS_RowState[jid] = row
+        if pause:
+            with beat(5):
+                update_row(table1, jid - 1, row)
+        else:
+            update_row(table1, jid - 1, row)
+
     # ---------------------------------------------------------
     # 1️⃣ Move jobs from Ready Queue → Running (CPU), if CPU available
     # ---------------------------------------------------------
-    if len(FCFS_ReadyQueue) > 0:
-        for job in FCFS_ReadyQueue:
-            # If there’s an available CPU slot, assign the job to it
-            if len(FCFS_Running) < Num_CPUs:
-                FCFS_Running.append(job)
-                with beat(5):
-                    update_row(table1, (job.get_id() - 1),
-                               [str(job.get_arrival_time()), " ", " ",
-                                f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                                " ", " ", " ", " "])
-                # Once a job is assigned to CPU, remove it from Ready Queue
-                FCFS_ReadyQueue.remove(job)
-
-            # If no CPU is available, job must wait
-            else:
-                job.increment_ready_wait_time()
-                with beat(5):
-                    update_row(table1, (job.get_id() - 1),
-                               [str(job.get_arrival_time()), " ",
-                                f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                                " ", " ", " ", " ", " "])
+    # While there’s an available CPU slot, assign the job at the front to it
+    while FCFS_ReadyQueue and len(FCFS_Running) < Num_CPUs:
+        job = FCFS_ReadyQueue.popleft()
+        FCFS_Running.append(job)
+        show_row(job, COL_RUNNING)
+
+    # No CPU is available for the rest, they must wait
+    for job in FCFS_ReadyQueue:
+        job.increment_ready_wait_time()
+        show_row(job, COL_READY, pause=False)
 
     # ---------------------------------------------------------
     # 2️⃣ Process jobs currently in the Running (CPU) state
     # ---------------------------------------------------------
+    keep = []  # jobs that stay on a CPU this tick
     for job in FCFS_Running:
+        burst_type = job.get_burst_type()  # every branch that changes it moves the job on
 
         # --- Handle I/O Bursts ---
-        if job.get_burst_type() == "IO":
+        if burst_type == "IO":
             # Move job to Waiting Queue to perform I/O
             FCFS_WaitingQueue.append(job)
-            with beat(5):
-                update_row(table1, (job.get_id() - 1),
-                           [str(job.get_arrival_time()), " ", " ", " ",
-                            f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                            " ", " ", " "])
-            FCFS_Running.remove(job)
+            show_row(job, COL_WAITING)
             continue
 
         # --- Handle CPU Bursts ---
-        if job.get_burst_type() == "CPU":
+        if burst_type == "CPU":
             # If current CPU burst has finished
             if job.get_burst_time() == 0:
                 job.get_next_burst()              # Move to next burst (I/O or EXIT)
                 FCFS_WaitingQueue.append(job)     # Move to waiting queue
-                with beat(5):
-                    update_row(table1, (job.get_id() - 1),
-                               [str(job.get_arrival_time()), " ", " ", " ",
-                                f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                                " ", " ", " "])
-                FCFS_Running.remove(job)
+                show_row(job, COL_WAITING)
                 continue
 
             # If CPU burst still ongoing
@@ -68,103 +85,74 @@ if sched == "FCFS" or sched == "ALL":
                 job.decrement_burst_time()    # Decrease remaining CPU burst time
                 job.increment_running_time()  # Track how long it has run
 
-                with beat(5):
-                    update_row(table1, (job.get_id() - 1),
-                               [str(job.get_arrival_time()), " ", " ",
-                                f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                                " ", " ", " ", " "])
+                show_row(job, COL_RUNNING, pause=False)
 
                 # If job completes CPU burst after decrementing
                 if job.get_burst_time() == 0:
                     job.get_next_burst()
                     FCFS_WaitingQueue.append(job)
-                    with beat(5):
-                        update_row(table1, (job.get_id() - 1),
-                                   [str(job.get_arrival_time()), " ", " ", " ",
-                                    f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                                    " ", " ", " "])
-                    FCFS_Running.remove(job)
+                    show_row(job, COL_WAITING)
                     continue
 
         # --- Handle Job Completion (Exit) ---
-        if job.get_burst_type() == "EXIT":
+        if burst_type == "EXIT":
             job.set_exit_time(clock)           # Mark completion time
             FCFS_FinishedQueue.append(job)     # Move job to finished queue
-            with beat(5):
-                update_row(table1, (job.get_id() - 1),
-                           [str(job.get_arrival_time()), " ", " ", " ", " ", " ",
-                            f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                            str(job.get_exit_time())])
-            FCFS_Running.remove(job)
+            show_row(job, COL_EXIT)
+            continue
+
+        keep.append(job)
+    FCFS_Running[:] = keep
 
     # ---------------------------------------------------------
     # 3️⃣ Move jobs from Waiting Queue → I/O Queue or Ready Queue
     # ---------------------------------------------------------
-    for job in FCFS_WaitingQueue:
+    # Rotate through the queue once: jobs that must keep waiting go back on the end
+    for _ in range(len(FCFS_WaitingQueue)):
+        job = FCFS_WaitingQueue.popleft()
 
         # --- Handle I/O Bursts ---
         if job.get_burst_type() == "IO":
             # If an I/O device is available, move job to I/O queue
             if len(FCFS_IO_Queue) < ios:
                 FCFS_IO_Queue.append(job)
-                with beat(5):
-                    update_row(table1, (job.get_id() - 1),
-                               [str(job.get_arrival_time()), " ", " ", " ", " ",
-                                f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                                " ", " "])
-                FCFS_WaitingQueue.remove(job)
+                show_row(job, COL_IO)
 
             # Otherwise, job must wait for I/O to become free
             else:
                 job.increment_io_wait_time()
-                with beat(5):
-                    update_row(table1, (job.get_id() - 1),
-                               [str(job.get_arrival_time()), " ", " ", " ",
-                                f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                                " ", " ", " "])
+                show_row(job, COL_WAITING, pause=False)
+                FCFS_WaitingQueue.append(job)
 
         # --- Handle CPU-Ready Jobs (post-I/O or new arrivals) ---
         else:
             FCFS_ReadyQueue.append(job)
-            with beat(5):
-                update_row(table1, (job.get_id() - 1),
-                           [str(job.get_arrival_time()), " ",
-                            f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                            " ", " ", " ", " ", " "])
-            FCFS_WaitingQueue.remove(job)
+            show_row(job, COL_READY)
 
     # ---------------------------------------------------------
     # 4️⃣ Process jobs currently in the I/O Queue
     # ---------------------------------------------------------
-    for job in FCFS_IO_Queue:
+    # Rotate through the queue once: jobs still performing I/O go back on the end
+    for _ in range(len(FCFS_IO_Queue)):
+        job = FCFS_IO_Queue.popleft()
 
         # --- If I/O burst finished ---
         if job.get_burst_time() == 0:
             job.get_next_burst()
             FCFS_ReadyQueue.append(job)
-            with beat(5):
-                update_row(table1, (job.get_id() - 1),
-                           [str(job.get_arrival_time()), " ",
-                            f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                            " ", " ", " ", " ", " "])
-            FCFS_IO_Queue.remove(job)
+            show_row(job, COL_READY)
+            continue
 
         # --- If still performing I/O ---
         else:
             job.decrement_burst_time()  # Continue processing I/O burst
-            with beat(5):
-                update_row(table1, (job.get_id() - 1),
-                           [str(job.get_arrival_time()), " ", " ", " ", " ",
-                            f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                            " ", " "])
+            show_row(job, COL_IO, pause=False)
 
             # When I/O burst completes after decrement
             if job.get_burst_time() == 0:
                 job.get_next_burst()
                 FCFS_ReadyQueue.append(job)
-                with beat(5):
-                    update_row(table1, job.get_id() - 1,
-                               [str(job.get_arrival_time()), " ",
-                                f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                                " ", " ", " ", " ", " "])
-                FCFS_IO_Queue.remove(job)
+                show_row(job, COL_READY)
+                continue
+
+        FCFS_IO_Queue.append(job)
@@ -11,193 +11,224 @@ This scheduling algorithm chooses jobs to execute based on their priority values
 - Disadvantage: Can cause starvation for low-priority jobs.
 """
 
+import heapq
+import itertools
+from collections import defaultdict, deque
+
+from schedulers.common import COL_RUNNING, COL_WAITING, COL_EXIT, advance_io, advance_waiting, make_row
+
 # Priority-Based Scheduling
 if sched == "PB" or sched == "ALL":
 
+    # The Waiting and I/O queues are FIFOs; make them deques the first time through
+    if not isinstance(PB_WaitingQueue, deque):
+        PB_WaitingQueue = deque(PB_WaitingQueue)
+        PB_IO_Queue = deque(PB_IO_Queue)
+
+    # Last row written to table2 for each row index, so unchanged rows are not redrawn. The memo
+    # mirrors what table2 shows, so it starts over on a new run: at clock 0, or when the
+    # caller hands in a different table
+    try:
+        PB_RowState
+    except NameError:
+        PB_RowState = {}
+        PB_RowTable = table2
+    if clock == 0 or PB_RowTable is not table2:
+        PB_RowState = {}
+        PB_RowTable = table2
+
+    # Rows changed this tick, by table2 row index; shown together in one beat at the end
+    PB_Rows = {}
+
+    def pb_show(job, col, label=None):
+        """Queue a job's table2 row for this tick, with label (default its burst) in column col"""
+        PB_Rows[job.get_id() - 1] = make_row(job, col, pb_label(job) if label is None else label)
+
+    def pb_label(job):
+        """A job's table2 cell text: id, current burst and priority"""
+        return f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()} P: {job.get_priority()}"
+
+    # PB_ReadyQueue stays the caller's plain list of ready jobs, in the order they became
+    # ready. A bucket queue over it picks the next one: PB_Buckets holds one FIFO per
+    # priority and bit (p - PB_BaseP) of PB_ReadyBits is set while bucket p is nonempty, so
+    # the highest-priority (lowest number) ready job heads the bucket of the lowest set bit.
+    # The first PB_Indexed jobs of PB_ReadyQueue are in the buckets; the caller only appends,
+    # so any after them are new arrivals. The index is rebuilt from the list on a new run,
+    # or if the list is not the one that was indexed
+    try:
+        PB_IndexedQueue
+    except NameError:
+        PB_IndexedQueue = None
+    if clock == 0 or PB_IndexedQueue is not PB_ReadyQueue or len(PB_ReadyQueue) < PB_Indexed:
+        PB_Buckets = defaultdict(deque)
+        PB_ReadyBits = 0
+        PB_BaseP = 0  # priority of bit 0, lowered when a lower priority shows up
+        PB_Indexed = 0
+        PB_IndexedQueue = PB_ReadyQueue
+
+    # PB_Running also stays the caller's plain list of jobs. PB_RunHeap is a max-heap of
+    # (-priority, seq, job) over it, so the running job to preempt first is PB_RunHeap[0];
+    # seq keeps equal priorities in the order they got a CPU and is never a tie. Rebuilt
+    # from the list under the same conditions as the buckets
+    try:
+        PB_HeapedRunning
+    except NameError:
+        PB_HeapedRunning = None
+    if clock == 0 or PB_HeapedRunning is not PB_Running or len(PB_RunHeap) != len(PB_Running):
+        PB_Seq = itertools.count()
+        PB_RunHeap = [(-job.get_priority(), next(PB_Seq), job) for job in PB_Running]
+        heapq.heapify(PB_RunHeap)
+        PB_HeapedRunning = PB_Running
+
+    def pb_index(job):
+        """Add a ready job to the back of its priority's bucket"""
+        global PB_ReadyBits, PB_BaseP
+        priority = job.get_priority()
+        if priority < PB_BaseP:  # shift the bitmask so no bit index goes negative
+            PB_ReadyBits <<= PB_BaseP - priority
+            PB_BaseP = priority
+        PB_Buckets[priority].append(job)
+        PB_ReadyBits |= 1 << (priority - PB_BaseP)
+
+    def pb_ready(job):
+        """Make a job ready: append it to PB_ReadyQueue and index it"""
+        global PB_Indexed
+        PB_ReadyQueue.append(job)
+        PB_Indexed += 1
+        pb_index(job)
+
+    def pb_best():
+        """Priority of the highest-priority ready job (only valid while PB_ReadyBits is set)"""
+        return (PB_ReadyBits & -PB_ReadyBits).bit_length() - 1 + PB_BaseP
+
+    def pb_take():
+        """Remove and return the first job of the highest-priority bucket"""
+        global PB_ReadyBits
+        priority = pb_best()
+        bucket = PB_Buckets[priority]
+        job = bucket.popleft()
+        if not bucket:
+            PB_ReadyBits &= ~(1 << (priority - PB_BaseP))
+        PB_Taken.add(id(job))
+        return job
+
+    def pb_run(job):
+        """Put a job on a CPU and show it there"""
+        PB_Running.append(job)
+        heapq.heappush(PB_RunHeap, (-job.get_priority(), next(PB_Seq), job))
+        pb_show(job, COL_RUNNING)
+
+    # Index the jobs the caller appended since the last tick
+    for i in range(PB_Indexed, len(PB_ReadyQueue)):
+        pb_index(PB_ReadyQueue[i])
+    PB_Indexed = len(PB_ReadyQueue)
+
     # ---------------------------------------------------------
     # 1️⃣ Move jobs from Ready Queue → Running (CPU), if CPU available or preemption occurs
     # ---------------------------------------------------------
-    if len(PB_ReadyQueue) > 0:
-        for job in PB_ReadyQueue:
-
-            # --- Case 1: CPU available, assign job directly ---
-            if len(PB_Running) < Num_CPUs:
-                PB_Running.append(job)
-                with beat(5):
-                    update_row(table2, (job.get_id() - 1),
-                               [str(job.get_arrival_time()), " ", " ",
-                                f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()} "
-                                f"P: {job.get_priority()}",
-                                " ", " ", " ", " "])
-                PB_ReadyQueue.remove(job)
-
-            # --- Case 2: CPU full, check if preemption is needed ---
-            else:
-                for PB_job in PB_Running:
-                    # If the new job has a higher priority (lower number)
-                    if PB_job.get_priority() > job.get_priority():
-
-                        # Preempt the lower-priority job
-                        PB_Running.append(job)
-                        with beat(5):
-                            update_row(table2, (job.get_id() - 1),
-                                       [str(job.get_arrival_time()), " ", " ",
-                                        f"J{job.get_id()} {job.get_burst_type()} "
-                                        f"{job.get_burst_time()} P: {job.get_priority()}",
-                                        " ", " ", " ", " "])
-                        PB_ReadyQueue.remove(job)
-
-                        # Move preempted job to Waiting Queue
-                        PB_WaitingQueue.append(PB_job)
-                        with beat(5):
-                            update_row(table2, (PB_job.get_id() - 1),
-                                       [str(PB_job.get_arrival_time()), " ", " ", "",
-                                        f"J{PB_job.get_id()}, BT: {PB_job.get_burst_type()}",
-                                        " ", " ", " "])
-                        PB_Running.remove(PB_job)
-                        break
-
-                    # Otherwise, if the new job is lower or equal in priority, it must wait
-                    else:
-                        job.increment_ready_wait_time()
+    # Open CPU slots; only the Case 1 loop fills them
+    free = Num_CPUs - len(PB_Running)
+
+    # The cheap scalar guard: with no ready job, or every CPU busy and the best ready
+    # priority no better than the worst running one, stage 1 has nothing to do
+    if PB_ReadyBits and (free > 0 or (PB_RunHeap and -PB_RunHeap[0][0] > pb_best())):
+        PB_Taken = set()  # ids of the ready jobs put on a CPU this tick
+
+        # --- Case 1: CPU available, assign the highest-priority jobs directly ---
+        while PB_ReadyBits and free > 0:
+            pb_run(pb_take())
+            free -= 1
+
+        # --- Case 2: CPU full, preempt while the best ready job beats the worst running one ---
+        while PB_ReadyBits and PB_RunHeap and -PB_RunHeap[0][0] > pb_best():
+            PB_job = heapq.heappop(PB_RunHeap)[-1]
+            PB_Running.remove(PB_job)  # at most Num_CPUs entries
+            pb_run(pb_take())
+
+            # Move preempted job to Waiting Queue
+            PB_WaitingQueue.append(PB_job)
+            pb_show(PB_job, COL_WAITING, f"J{PB_job.get_id()}, BT: {PB_job.get_burst_type()}")
+
+        # The guard means at least one job was put on a CPU; drop those from the caller's
+        # list in one pass, keeping its order
+        ready = [job for job in PB_ReadyQueue if id(job) not in PB_Taken]
+        PB_ReadyQueue.clear()
+        PB_ReadyQueue.extend(ready)
+        PB_Indexed = len(ready)
+
+    # Otherwise, the remaining jobs are lower or equal in priority and must wait
+    for job in PB_ReadyQueue:
+        job.increment_ready_wait_time()
 
     # ---------------------------------------------------------
     # 2️⃣ Process jobs currently running on the CPU
     # ---------------------------------------------------------
+    keep = []  # running jobs still on a CPU after this tick
     for job in PB_Running:
+        burst_type = job.get_burst_type()  # every branch that changes it moves the job on
 
         # --- Handle I/O bursts ---
-        if job.get_burst_type() == "IO":
+        if burst_type == "IO":
             PB_WaitingQueue.append(job)
-            with beat(5):
-                update_row(table2, (job.get_id() - 1),
-                           [str(job.get_arrival_time()), " ", " ", " ",
-                            f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()} "
-                            f"P: {job.get_priority()}",
-                            " ", " ", " "])
-            PB_Running.remove(job)
+            pb_show(job, COL_WAITING)
             continue
 
         # --- Handle CPU bursts ---
-        if job.get_burst_type() == "CPU":
+        if burst_type == "CPU":
 
             # If the CPU burst has completed
             if job.get_burst_time() == 0:
                 job.get_next_burst()             # Move to next burst (IO/EXIT)
                 PB_WaitingQueue.append(job)
-                with beat(5):
-                    update_row(table2, (job.get_id() - 1),
-                               [str(job.get_arrival_time()), " ", " ", " ",
-                                f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()} "
-                                f"P: {job.get_priority()}",
-                                " ", " ", " "])
-                PB_Running.remove(job)
+                pb_show(job, COL_WAITING)
                 continue
 
             # If still running CPU burst
             else:
                 job.decrement_burst_time()        # Decrease CPU burst time
                 job.increment_running_time()      # Track how long it’s been running
-                with beat(5):
-                    update_row(table2, (job.get_id() - 1),
-                               [str(job.get_arrival_time()), " ", " ",
-                                f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()} "
-                                f"P: {job.get_priority()}",
-                                " ", " ", " ", " "])
+                pb_show(job, COL_RUNNING)
 
                 # If burst finishes after decrement
                 if job.get_burst_time() == 0:
                     job.get_next_burst()
                     PB_WaitingQueue.append(job)
-                    with beat(5):
-                        update_row(table2, (job.get_id() - 1),
-                                   [str(job.get_arrival_time()), " ", " ", " ",
-                                    f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()} "
-                                    f"P: {job.get_priority()}",
-                                    " ", " ", " "])
-                    PB_Running.remove(job)
+                    pb_show(job, COL_WAITING)
                     continue
 
         # --- Handle jobs that have completed all bursts (EXIT) ---
-        if job.get_burst_type() == "EXIT":
+        if burst_type == "EXIT":
             job.set_exit_time(clock)
             PB_FinishedQueue.append(job)
-            with beat(5):
-                update_row(table2, (job.get_id() - 1),
-                           [str(job.get_arrival_time()), " ", " ", " ", " ", " ",
-                            f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()} "
-                            f"P: {job.get_priority()}",
-                            str(job.get_exit_time())])
-            PB_Running.remove(job)
+            pb_show(job, COL_EXIT)
+            continue
+
+        keep.append(job)
+    # Update the caller's list and the running heap only if a job left a CPU; dropping
+    # entries can break the heap order, so it is re-heapified, otherwise it is untouched
+    if len(keep) != len(PB_Running):
+        PB_Running[:] = keep
+        kept = set(map(id, keep))
+        PB_RunHeap[:] = [entry for entry in PB_RunHeap if id(entry[-1]) in kept]
+        heapq.heapify(PB_RunHeap)
 
     # ---------------------------------------------------------
     # 3️⃣ Move jobs from Waiting Queue → I/O Queue or Ready Queue
     # ---------------------------------------------------------
-    for job in PB_WaitingQueue:
-
-        # --- Handle I/O bursts ---
-        if job.get_burst_type() == "IO":
-            # If an I/O device is free, start I/O
-            if len(PB_IO_Queue) < ios:
-                PB_IO_Queue.append(job)
-                with beat(5):
-                    update_row(table2, (job.get_id() - 1),
-                               [str(job.get_arrival_time()), " ", " ", " ", " ",
-                                f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()} "
-                                f"P: {job.get_priority()}",
-                                " ", " "])
-                PB_WaitingQueue.remove(job)
-
-            # Otherwise, wait for I/O availability
-            else:
-                job.increment_io_wait_time()
-
-        # --- Handle CPU-ready jobs ---
-        else:
-            PB_ReadyQueue.append(job)
-            with beat(5):
-                update_row(table2, (job.get_id() - 1),
-                           [str(job.get_arrival_time()), " ",
-                            f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()} "
-                            f"P: {job.get_priority()}",
-                            " ", " ", " ", " ", " "])
-            PB_WaitingQueue.remove(job)
+    advance_waiting(PB_WaitingQueue, PB_IO_Queue, ios, pb_ready, pb_show)
 
     # ---------------------------------------------------------
     # 4️⃣ Process jobs currently in the I/O Queue
     # ---------------------------------------------------------
-    for job in PB_IO_Queue:
-
-        # --- If I/O burst is finished ---
-        if job.get_burst_time() == 0:
-            job.get_next_burst()
-            PB_ReadyQueue.append(job)
-            with beat(5):
-                update_row(table2, (job.get_id() - 1),
-                           [str(job.get_arrival_time()), " ",
-                            f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()} "
-                            f"P: {job.get_priority()}",
-                            " ", " ", " ", " ", " "])
-            PB_IO_Queue.remove(job)
-
-        # --- If I/O burst still in progress ---
-        else:
-            job.decrement_burst_time()
-            with beat(5):
-                update_row(table2, (job.get_id() - 1),
-                           [str(job.get_arrival_time()), " ", " ", " ", " ",
-                            f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()} "
-                            f"P: {job.get_priority()}",
-                            " ", " "])
-
-            # Once I/O completes after decrement
-            if job.get_burst_time() == 0:
-                job.get_next_burst()
-                PB_ReadyQueue.append(job)
-                with beat(5):
-                    update_row(table2, (job.get_id() - 1),
-                               [str(job.get_arrival_time()), " ",
-                                f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()} "
-                                f"P: {job.get_priority()}",
-                                " ", " ", " ", " ", " "])
-                PB_IO_Queue.remove(job)
+    advance_io(PB_IO_Queue, pb_ready, pb_show)
+
+    # ---------------------------------------------------------
+    # 5️⃣ Show every row that changed this tick in a single beat
+    # ---------------------------------------------------------
+    # Rows that ended the tick the way table2 already shows them are not redrawn
+    changed = [(row, cells) for row, cells in PB_Rows.items() if PB_RowState.get(row) != cells]
+    if changed:
+        with beat(5):
+            for row, cells in changed:
+                PB_RowState[row] = cells
+                update_row(table2, row, cells)
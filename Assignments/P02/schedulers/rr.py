@@ -3,44 +3,71 @@ Round Robin Scheduling (RR) is a scheduling algorithm that assigns a fixed numbe
 Each process gets a small unit of CPU time (called a time slice or quantum) and then is moved to the back of the queue.
 """
 
+from collections import deque
+
+from schedulers.common import COL_RUNNING, COL_WAITING, COL_EXIT, advance_io, advance_waiting, make_row
+
 # Round Robin scheduling
 if sched == "RR" or sched == "ALL":
 
+    # The FIFO queues are deques so jobs leave from the front in O(1);
+    # convert them the first time through if they were created as lists
+    if not isinstance(RR_ReadyQueue, deque):
+        RR_ReadyQueue = deque(RR_ReadyQueue)
+        RR_WaitingQueue = deque(RR_WaitingQueue)
+        RR_IO_Queue = deque(RR_IO_Queue)
+
+    # Last row written to table3 for each row index, so unchanged rows are not redrawn. The memo
+    # mirrors what table3 shows, so it starts over on a new run: at clock 0, or when the
+    # caller hands in a different table
+    try:
+        RR_RowState
+    except NameError:
+        RR_RowState = {}
+        RR_RowTable = table3
+    if clock == 0 or RR_RowTable is not table3:
+        RR_RowState = {}
+        RR_RowTable = table3
+
+    # Rows changed this tick, by table3 row index; shown together in one beat at the end
+    RR_Rows = {}
+
+    def rr_show(job, col, label=None):
+        """Queue a job's table3 row for this tick, with label (default its burst) in column col"""
+        RR_Rows[job.get_id() - 1] = make_row(job, col, rr_label(job) if label is None else label)
+
+    def rr_label(job):
+        """A job's table3 cell text: id and current burst"""
+        return f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}"
+
     # -----------------------------
     # 1️⃣ Assign jobs from Ready Queue to Running (CPU) if CPU is available
     # -----------------------------
-    if len(RR_ReadyQueue) > 0:
-        for job in RR_ReadyQueue:
-            if len(RR_Running) < Num_CPUs:  # If CPU slot is free
-                RR_Running.append(job)  # Move job to running state
-                with beat(5):
-                    update_row(table3, (job.get_id() - 1),
-                               [str(job.get_arrival_time()), " ", " ",
-                                f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                                " ", " ", " ", " "])
-                RR_ReadyQueue.remove(job)  # Remove job from ready queue
-            else:
-                # If all CPUs are busy, increase the job's waiting time
-                job.increment_ready_wait_time()
+    # Move one job from the front to running state for each free CPU slot
+    for _ in range(min(Num_CPUs - len(RR_Running), len(RR_ReadyQueue))):
+        job = RR_ReadyQueue.popleft()
+        RR_Running.append(job)
+        rr_show(job, COL_RUNNING)
+
+    # If all CPUs are busy, increase the waiting time of the rest
+    for job in RR_ReadyQueue:
+        job.increment_ready_wait_time()
 
     # -----------------------------
     # 2️⃣ Process jobs currently running on CPU
     # -----------------------------
+    keep = []  # jobs that stay on a CPU this tick
     for job in RR_Running:
+        burst_type = job.get_burst_type()  # every branch that changes it moves the job on
 
         # --- Handle I/O Bursts ---
-        if job.get_burst_type() == "IO":
+        if burst_type == "IO":
             RR_WaitingQueue.append(job)  # Move job to waiting queue for I/O
-            with beat(5):
-                update_row(table3, (job.get_id() - 1),
-                           [str(job.get_arrival_time()), " ", " ", " ",
-                            f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                            " ", " ", " "])
-            RR_Running.remove(job)
+            rr_show(job, COL_WAITING)
             continue
 
         # --- Handle CPU Bursts ---
-        if job.get_burst_type() == "CPU":
+        if burst_type == "CPU":
 
             # Case 1: Job has not exceeded its time slice
             if job.get_cpu_time() <= time_slice:
@@ -50,12 +77,7 @@ if sched == "RR" or sched == "ALL":
                     job.get_next_burst()        # Move to next burst (could be IO or EXIT)
                     job.reset_cpu_time()        # Reset CPU time for next burst
                     RR_WaitingQueue.append(job) # Move to waiting queue
-                    with beat(5):
-                        update_row(table3, (job.get_id() - 1),
-                                   [str(job.get_arrival_time()), " ", " ", " ",
-                                    f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                                    " ", " ", " "])
-                    RR_Running.remove(job)
+                    rr_show(job, COL_WAITING)
                     continue
                 else:
                     # Decrement burst time and increment counters
@@ -64,105 +86,50 @@ if sched == "RR" or sched == "ALL":
                     job.increment_cpu_time()
 
                     # Update display
-                    with beat(5):
-                        update_row(table3, (job.get_id() - 1),
-                                   [str(job.get_arrival_time()), " ", " ",
-                                    f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()} P: {job.get_priority()}",
-                                    " ", " ", " ", " "])
+                    rr_show(job, COL_RUNNING, f"{rr_label(job)} P: {job.get_priority()}")
 
                     # If job finished CPU burst after decrementing
                     if job.get_burst_time() == 0:
                         job.get_next_burst()
                         job.reset_cpu_time()
                         RR_WaitingQueue.append(job)
-                        with beat(5):
-                            update_row(table3, (job.get_id() - 1),
-                                       [str(job.get_arrival_time()), " ", " ", " ",
-                                        f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                                        " ", " ", " "])
-                        RR_Running.remove(job)
+                        rr_show(job, COL_WAITING)
                         continue
 
             # Case 2: Job has exceeded its time slice → preempted
             else:
                 job.reset_cpu_time()
                 RR_WaitingQueue.append(job)  # Move back to waiting queue
-                with beat(5):
-                    update_row(table3, (job.get_id() - 1),
-                               [str(job.get_arrival_time()), " ", " ", " ",
-                                f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                                " ", " ", " "])
-                RR_Running.remove(job)
+                rr_show(job, COL_WAITING)
+                continue
 
         # --- Handle Job Completion ---
-        if job.get_burst_type() == "EXIT":
+        if burst_type == "EXIT":
             job.set_exit_time(clock)  # Record exit time
             RR_FinishedQueue.append(job)
-            with beat(5):
-                update_row(table3, (job.get_id() - 1),
-                           [str(job.get_arrival_time()), " ", " ", " ", " ", " ",
-                            f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                            str(job.get_exit_time())])
-            RR_Running.remove(job)
+            rr_show(job, COL_EXIT)
+            continue
+
+        keep.append(job)
+    RR_Running[:] = keep
 
     # -----------------------------
     # 3️⃣ Move jobs from Waiting Queue → I/O Queue or Ready Queue
     # -----------------------------
-    for job in RR_WaitingQueue:
-        if job.get_burst_type() == "IO":
-            # If I/O device available
-            if len(RR_IO_Queue) < ios:
-                RR_IO_Queue.append(job)
-                with beat(5):
-                    update_row(table3, (job.get_id() - 1),
-                               [str(job.get_arrival_time()), " ", " ", " ", " ",
-                                f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                                " ", " "])
-                RR_WaitingQueue.remove(job)
-            else:
-                # Waiting for I/O device
-                job.increment_io_wait_time()
-        else:
-            # Move CPU-ready jobs back to ready queue
-            RR_ReadyQueue.append(job)
-            with beat(5):
-                update_row(table3, (job.get_id() - 1),
-                           [str(job.get_arrival_time()), " ",
-                            f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                            " ", " ", " ", " ", " "])
-            RR_WaitingQueue.remove(job)
+    advance_waiting(RR_WaitingQueue, RR_IO_Queue, ios, RR_ReadyQueue.append, rr_show)
 
     # -----------------------------
     # 4️⃣ Process jobs in I/O Queue
     # -----------------------------
-    for job in RR_IO_Queue:
-
-        # I/O burst completed → move back to ready queue
-        if job.get_burst_time() == 0:
-            job.get_next_burst()
-            RR_ReadyQueue.append(job)
-            with beat(5):
-                update_row(table3, (job.get_id() - 1),
-                           [str(job.get_arrival_time()), " ",
-                            f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                            " ", " ", " ", " ", " "])
-            RR_IO_Queue.remove(job)
-        else:
-            # Continue I/O burst
-            job.decrement_burst_time()
-            with beat(5):
-                update_row(table3, (job.get_id() - 1),
-                           [str(job.get_arrival_time()), " ", " ", " ", " ",
-                            f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                            " ", " "])
-
-            # If I/O burst finishes after decrement
-            if job.get_burst_time() == 0:
-                job.get_next_burst()
-                RR_ReadyQueue.append(job)
-                with beat(5):
-                    update_row(table3, (job.get_id() - 1),
-                               [str(job.get_arrival_time()), " ",
-                                f"J{job.get_id()} {job.get_burst_type()} {job.get_burst_time()}",
-                                " ", " ", " ", " ", " "])
-                RR_IO_Queue.remove(job)
+    advance_io(RR_IO_Queue, RR_ReadyQueue.append, rr_show)
+
+    # -----------------------------
+    # 5️⃣ Show every row that changed this tick in a single beat
+    # -----------------------------
+    # Rows that ended the tick the way table3 already shows them are not redrawn
+    changed = [(row, cells) for row, cells in RR_Rows.items() if RR_RowState.get(row) != cells]
+    if changed:
+        with beat(5):
+            for row, cells in changed:
+                RR_RowState[row] = cells
+                update_row(table3, row, cells)